@@ -1,15 +1,16 @@
 import json
 import pandas as pd
-from utils.excel_save  import export_cart_xlsx
 from pathlib import Path
 
+from rule_schema import RulesJson
 
-# 파일 불러오기 및 전처리
-cb = pd.read_excel("data/test.xlsx", sheet_name="codebook")
 
-codebook_df = cb.dropna(subset=["문항"]).reset_index(drop=True)
+# 파일 불러오기 및 전처리
+def load_codebook(path: str | Path = "data/test.xlsx", sheet_name: str = "codebook") -> pd.DataFrame:
+    """코드북 시트를 읽고 '문항'이 비어있는 행 제거"""
+    cb = pd.read_excel(path, sheet_name=sheet_name)
+    return cb.dropna(subset=["문항"]).reset_index(drop=True)
 
-print(codebook_df.head())
 
 # range_items 범위 지정
 def parse_options(응답: str) -> list[dict]:
@@ -24,7 +25,7 @@ def parse_options(응답: str) -> list[dict]:
         list[int]:
             - 형식이 올바른 경우: 추출된 정수 코드들의 리스트   예: [1, 2, 3]
             - 형식이 올바르지 않은 경우: 빈 리스트 []          (범위 검증 대상 아님을 의미)
-            
+
     내부 변수
         line (str): 줄 단위로 분리된 응답 문자열의 한 행.
         colon_index (int): line 문자열에서 첫 번째 ':' 문자가 등장하는 위치(index).
@@ -32,6 +33,9 @@ def parse_options(응답: str) -> list[dict]:
         code_values (list[int]): 형식 검증을 통과한 정수 코드들을 누적 저장하는 리스트.
     """
     pairs = []
+    if not isinstance(응답, str):
+        return pairs
+
     for raw in 응답.splitlines():  # 문자열을 줄단위로 쪼개기 ex)["1: 남자", "2: 여자", "3: 기타"]
         line = raw.strip()  # 앞뒤 공백 제거
         if not line:
@@ -41,7 +45,7 @@ def parse_options(응답: str) -> list[dict]:
         colon_index = line.find(":")
         if colon_index == -1:     # -1의 의미 : 해당 문자를 찾지못함
             continue
-    
+
 
         # 2) 구분자 앞 부분을 코드 후보로
         code_str = line[:colon_index].strip()
@@ -50,87 +54,143 @@ def parse_options(응답: str) -> list[dict]:
         # 3) 숫자인 경우만 코드로 인정
         if code_str.isdigit():              # isdigit() : 문자열이 숫자로만 이루어져있는지 확인
             pairs.append({"code": int(code_str), "label": label})
-            
+
     return pairs
 
-# 'codes_values' 컬럼에 추출된 코드 리스트 저장
-codebook_df["codes_values"] = codebook_df["응답"].apply(parse_options)
 
-codebook_df["check_range"] = codebook_df["codes_values"].apply(bool)
+def prepare_codebook(codebook_df: pd.DataFrame) -> pd.DataFrame:
+    """선택지 코드 추출 및 검증 항목 플래그 추가"""
+    # 'codes_values' 컬럼에 추출된 코드 리스트 저장
+    codebook_df["codes_values"] = codebook_df["응답"].apply(parse_options)
 
-codebook_df["range_min"] = codebook_df["codes_values"].apply(
-    lambda x: min(o["code"] for o in x) if x else None
-)
-codebook_df["range_max"] = codebook_df["codes_values"].apply(
-    lambda x: max(o["code"] for o in x) if x else None
+    codebook_df["check_range"] = codebook_df["codes_values"].apply(bool)
 
-)
+    codebook_df["range_min"] = codebook_df["codes_values"].apply(
+        lambda x: min(o["code"] for o in x) if x else None
+    )
+    codebook_df["range_max"] = codebook_df["codes_values"].apply(
+        lambda x: max(o["code"] for o in x) if x else None
 
-codebook_df["check_missing"] = True
-codebook_df["check_multi"] = True
+    )
+
+    codebook_df["check_missing"] = True
+    codebook_df["check_multi"] = True
+    return codebook_df
 
 
 # json 구조화
-records = []
-
-for r in codebook_df.itertuples(index=False):
-    records.append({
-        "item": r.문항,
-        "question": r.질문,
-        "options": r.codes_values,
-    })
-    
-out_path = Path("data/codebook.json")
-out_path.parent.mkdir(parents=True, exist_ok=True)
-
-out_path.write_text(
-    json.dumps(records, ensure_ascii=False, indent=2),
-    encoding="utf-8"
-)
-
-print("saved:", out_path)
-
-
-
-# 검증 항목별 문항 리스트 생성
-missing_items = codebook_df.loc[codebook_df["check_missing"], "문항"].tolist()
-multiple_items = codebook_df.loc[codebook_df["check_multi"], "문항"].tolist()
-range_items = codebook_df.loc[codebook_df["check_range"], "문항"].tolist()
-
-# 검증 요약 데이터프레임 생성
-summary_df = pd.DataFrame({
-    "결측": [",".join(missing_items)],
-    "중복응답": [",".join(multiple_items)],
-    "범위": [",".join(range_items)]
-})
-
-
-# range 그룹 만들기 (min,max별로 같은 범위조건 문항 묶기)
-g = (codebook_df.loc[codebook_df["check_range"], ["문항", "range_min", "range_max"]]    # codebook_df["check_range"] == True인 행 필터링
-    .groupby(["range_min", "range_max"])["문항"]                                        # 'range_min', 'range_max' 컬럼으로 그룹화   ex) (1,5)그룹["A1", "A2"], (10,20)그룹["B1", "B2"]
-    .apply(lambda s: ", ".join(s))                                                      # 그룹별 '문항'들을 쉼표로 연결된 문자열로 변환 ex) (1,5)그룹 "A1, A2", (10,20)그룹 "B1, B2"
-    .reset_index(name="items"))                                                         # 인덱스를 초기화하고 'items'라는 이름의 컬럼으로 결과 저장
-print("범위 그룹화 결과:\n", g)
-
-# dict 하나 = 엑셀 한컬럼 형태로 넣을 수 있게 튜플형으로 변경
-range_columns = [{
-        "title": "범위",
-        "items": r.items,
-        "values": f"{int(r.range_min)}, {int(r.range_max)}"}
-    for r in g.itertuples(index=False)              # itertuples : DataFrame의 각 행을 튜플로 반환
-]
-
-print("범위 컬럼들:\n", range_columns)
-
-columns = [
-    {"title": "결측", "items": ",".join(missing_items), "values": ""},
-    {"title": "중복 응답", "items": ",".join(multiple_items), "values": ""},
-] + range_columns
-
-
-out = export_cart_xlsx(
-    columns=columns,
-    out_path="data/validation_cart.xlsx",
-    start_col=1,  # A부터
-)
-print("saved:", out)
\ No newline at end of file
+def save_codebook_json(codebook_df: pd.DataFrame, out_path: str | Path = "data/codebook.json") -> Path:
+    records = []
+
+    for r in codebook_df.itertuples(index=False):
+        records.append({
+            "item": r.문항,
+            "question": r.질문,
+            "options": r.codes_values,
+        })
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    out_path.write_text(
+        json.dumps(records, ensure_ascii=False, indent=2),
+        encoding="utf-8"
+    )
+    return out_path
+
+
+def build_rules(codebook_df: pd.DataFrame) -> RulesJson:
+    """코드북 플래그를 RulesJson(source='codebook')으로 변환"""
+    items = []
+    for r in codebook_df.itertuples(index=False):
+        rules = []
+        if r.check_missing:
+            rules.append({"rule_id": f"{r.문항}:miss_value", "rule_type": "miss_value", "source": "codebook"})
+        if r.check_multi:
+            rules.append({"rule_id": f"{r.문항}:multiple_response_check", "rule_type": "multiple_response_check", "source": "codebook"})
+        if r.check_range:
+            rules.append({
+                "rule_id": f"{r.문항}:between_a_b",
+                "rule_type": "between_a_b",
+                "source": "codebook",
+                "min": int(r.range_min),
+                "max": int(r.range_max),
+            })
+
+        items.append({
+            "item": r.문항,
+            "domain": {
+                "allowed_codes": [o["code"] for o in r.codes_values],
+                "code_label_map": {str(o["code"]): o["label"] for o in r.codes_values},
+            },
+            "rules": rules,
+        })
+
+    return {"version": "1", "items": items, "metadata": {"source": "codebook"}}
+
+
+def build_cart_columns(codebook_df: pd.DataFrame) -> list[dict]:
+    """검증 카트(엑셀 1~3행) 컬럼 블록 생성"""
+    # 검증 항목별 문항 리스트 생성
+    missing_items = codebook_df.loc[codebook_df["check_missing"], "문항"].tolist()
+    multiple_items = codebook_df.loc[codebook_df["check_multi"], "문항"].tolist()
+
+    # range 그룹 만들기 (min,max별로 같은 범위조건 문항 묶기)
+    g = (codebook_df.loc[codebook_df["check_range"], ["문항", "range_min", "range_max"]]    # codebook_df["check_range"] == True인 행 필터링
+        .groupby(["range_min", "range_max"])["문항"]                                        # 'range_min', 'range_max' 컬럼으로 그룹화   ex) (1,5)그룹["A1", "A2"], (10,20)그룹["B1", "B2"]
+        .apply(lambda s: ", ".join(s))                                                      # 그룹별 '문항'들을 쉼표로 연결된 문자열로 변환 ex) (1,5)그룹 "A1, A2", (10,20)그룹 "B1, B2"
+        .reset_index(name="items"))                                                         # 인덱스를 초기화하고 'items'라는 이름의 컬럼으로 결과 저장
+
+    # dict 하나 = 엑셀 한컬럼 형태로 넣을 수 있게 튜플형으로 변경
+    range_columns = [{
+            "title": "범위",
+            "items": r.items,
+            "values": f"{int(r.range_min)}, {int(r.range_max)}"}
+        for r in g.itertuples(index=False)              # itertuples : DataFrame의 각 행을 튜플로 반환
+    ]
+
+    return [
+        {"title": "결측", "items": ",".join(missing_items), "values": ""},
+        {"title": "중복 응답", "items": ",".join(multiple_items), "values": ""},
+    ] + range_columns
+
+
+def build_codebook_rules(
+    codebook_path: str | Path = "data/test.xlsx",
+    sheet_name: str = "codebook",
+    out_dir: str | Path = "data",
+) -> dict[str, Path]:
+    """코드북 → codebook.json / rules.json / validation_cart.xlsx 저장
+
+    Returns:
+        dict[str, Path]: 저장된 파일 경로들
+    """
+    from utils.excel_save import export_cart_xlsx
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    codebook_df = prepare_codebook(load_codebook(codebook_path, sheet_name))
+
+    rules_path = out_dir / "rules.json"
+    rules_path.write_text(
+        json.dumps(build_rules(codebook_df), ensure_ascii=False, indent=2),
+        encoding="utf-8"
+    )
+
+    cart_path = export_cart_xlsx(
+        columns=build_cart_columns(codebook_df),
+        out_path=out_dir / "validation_cart.xlsx",
+        start_col=1,  # A부터
+    )
+
+    return {
+        "codebook": save_codebook_json(codebook_df, out_dir / "codebook.json"),
+        "rules": rules_path,
+        "cart": cart_path,
+    }
+
+
+if __name__ == "__main__":
+    for name, path in build_codebook_rules().items():
+        print("saved:", name, path)
@@ -2,8 +2,31 @@
 # data_validator.py - 검증 메서드 클래스
 # =============================================================================
 import pandas as pd 
+import numpy as np
 import operator
 
+
+# 비교 연산자 표기 통일 (화면 라벨 → 기호)
+OP_LABELS = {
+    '<(작다)': '<',
+    '<=(작거나같다)': '<=',
+    '>(크다)': '>',
+    '>=(크거나같다)': '>=',
+    '==(같다)': '==',
+    '!=(다르다)': '!=',
+}
+
+
+def canonical_op(method):
+    """'<(작다)' / '<' 어느 쪽이 와도 기호 연산자로 변환"""
+    method = str(method).strip()
+    return OP_LABELS.get(method, method)
+
+
+# near_duplicate 후보쌍 확인 시 한 번에 비교할 칸 수 (쌍 수 × 문항 수)
+PAIR_CHUNK = 1 << 22
+
+
 class DataValidator:
     def __init__(self, df):
         self.df = df 
@@ -22,17 +45,36 @@ class DataValidator:
         self.df.loc[idx, error_col_name] = self.df.loc[idx, error_col_name].apply(
                 lambda x: col if x == '' else f"{x},{col}"
             )
-        
+
+    def _add_error_mask(self, mask, error_col_name):
+        """여러 문항 에러를 한 번에 기록 (문항마다 _add_error 를 부르는 것과 결과 동일)
+
+        Args:
+            mask (pd.DataFrame): 행 × 문항 bool (True = 에러)
+            error_col_name (str): 에러명
+        """
+        if error_col_name not in self.df.columns:
+            self.df[error_col_name] = ''
+
+        hit = mask[mask.any(axis=1)]
+        if hit.empty:
+            return
+
+        # 에러 칸에만 '문항명,' 을 두고 행 방향으로 이어붙임
+        names = np.array([f"{c}," for c in hit.columns], dtype=object)
+        joined = pd.Series(np.where(hit.to_numpy(), names, '').sum(axis=1), index=hit.index).str[:-1]
+
+        existing = self.df.loc[hit.index, error_col_name]
+        self.df.loc[hit.index, error_col_name] = existing.where(existing == '', existing + ',').str.cat(joined)
+
     def miss_value(self, columns):  # df 파라미터 제거
         """결측값 확인
 
         Args:
             columns (list[str]): 분석 할 문항명 
         """
-            
-        for col in columns:
-            idx = self.df[self.df[col].isna()].index  # self.df 사용
-            self._add_error(idx, col, 'Error_결측')
+
+        self._add_error_mask(self.df[columns].isna(), 'Error_결측')
             
     def between_a_b(self, columns, min, max):
         """범위 내의 값 확인 
@@ -44,9 +86,8 @@ class DataValidator:
             max (int): 최댓값
         """
 
-        for col in columns:
-            idx = self.df[self.df[col].notna() & ~self.df[col].between(min, max)].index
-            self._add_error(idx, col, 'Error_범위')
+        block = self.df[columns]
+        self._add_error_mask(block.notna() & ~((block >= min) & (block <= max)), 'Error_범위')
 
     def multiple_response_check(self, columns):
         """단일 응답 컬럼에서 다중 응답인 케이스 찾기"""
@@ -138,25 +179,27 @@ class DataValidator:
         Args:
             col1 (str): 비교 문항1
             col2 (str): 비교 문항2  
-            method (str): 비교 연산자 ('<', '<=', '>', '>=', '==', '!=')
+            method (str): 비교 연산자 ('<', '<=', '>', '>=', '==', '!=' 또는 '<(작다)' 등 라벨)
         """
+        method = canonical_op(method)
+
         # 미만
-        if method == '<(작다)':
+        if method == '<':
             condition = self.df[col1] < self.df[col2]
         # 이하
-        elif method == '<=(작거나같다)':
+        elif method == '<=':
             condition = self.df[col1] <= self.df[col2]
         # 초과
-        elif method == '>(크다)':
+        elif method == '>':
             condition = self.df[col1] > self.df[col2]
         # 이상
-        elif method == '>=(크거나같다)':
+        elif method == '>=':
             condition = self.df[col1] >= self.df[col2]
         # 같음
-        elif method == '==(같다)':
+        elif method == '==':
             condition = self.df[col1] == self.df[col2]
         # 같지 않음
-        elif method == '!=(다르다)':
+        elif method == '!=':
             condition = self.df[col1] != self.df[col2]
         else:
             return  # 잘못된 method인 경우
@@ -171,25 +214,27 @@ class DataValidator:
         Args:
             col (str): 비교할 문항
             val (int/float): 비교할 값
-            method (str): 비교 연산자 ('<', '<=', '>', '>=', '==', '!=')
+            method (str): 비교 연산자 ('<', '<=', '>', '>=', '==', '!=' 또는 '<(작다)' 등 라벨)
         """
+        method = canonical_op(method)
+
         # 미만
-        if method == '<(작다)':
+        if method == '<':
             condition = self.df[col] < val
         # 이하
-        elif method == '<=(작거나같다)':
+        elif method == '<=':
             condition = self.df[col] <= val
         # 초과
-        elif method == '>(크다)':
+        elif method == '>':
             condition = self.df[col] > val
         # 이상
-        elif method == '>=(크거나같다)':
+        elif method == '>=':
             condition = self.df[col] >= val
         # 같음
-        elif method == '==(같다)':
+        elif method == '==':
             condition = self.df[col] == val
         # 같지 않음
-        elif method == '!=(다르다)':
+        elif method == '!=':
             condition = self.df[col] != val
         else:
             return
@@ -288,7 +333,7 @@ class DataValidator:
         # 좌변, 우변 계산 후 비교
         left_result = calc(ct['left'])
         right_result = calc(ct['right'])
-        mask = compare_ops[ct['compare']](left_result, right_result)
+        mask = compare_ops[canonical_op(ct['compare'])](left_result, right_result)
         
         idx = self.df[mask].index
         
@@ -313,4 +358,115 @@ class DataValidator:
 
         idx = self.df[mask].index
 
-        self._add_error(idx, cols[0], 'Error_특정값존재(다중응답)')
\ No newline at end of file
+        self._add_error(idx, cols[0], 'Error_특정값존재(다중응답)')
+
+
+    def _data_columns(self, exclude=()):
+        """Error_ 컬럼과 exclude를 뺀 원본 데이터 컬럼들"""
+        return [col for col in self.df.columns
+                if not str(col).startswith('Error_') and col not in exclude]
+
+    def duplicate_respondent(self, columns=None, id_col=None):
+        """응답이 완전히 같은 중복 응답자 찾기 (행 해시 기반, O(n))
+
+        Args:
+            columns (list): 비교할 문항 (None이면 id_col 제외 전체 문항)
+            id_col (str): 응답자 ID 컬럼 (에러 표시용, 비교에서 제외)
+        """
+        cols = columns or self._data_columns(exclude=[id_col])
+
+        # 행마다 64bit 해시 → 해시가 같은 행들이 중복 후보
+        row_hash = pd.util.hash_pandas_object(self.df[cols], index=False)
+        mask = row_hash.duplicated(keep=False).to_numpy()
+
+        idx = self.df.index[mask]
+        self._add_error(idx, id_col or cols[0], 'Error_중복응답자')
+
+    def near_duplicate(self, columns=None, id_col=None, threshold=0.95,
+                       max_bucket=50, seed=0):
+        """일부 문항만 다른 유사 응답자 찾기 (블로킹 + 후보쌍 검증)
+
+        문항을 (허용 불일치 수 + 1)개의 밴드로 나누면, 유사도가 threshold 이상인
+        두 행은 적어도 하나의 밴드가 완전히 같다(비둘기집 원리).
+        밴드 해시가 같은 행끼리만 후보쌍으로 보고 실제 일치율을 계산한다.
+
+        Args:
+            columns (list): 비교할 문항 (None이면 id_col 제외 전체 문항)
+            id_col (str): 응답자 ID 컬럼 (에러 표시용, 비교에서 제외)
+            threshold (float): 같은 응답 비율 기준 (0~1, 결측끼리는 같다고 봄)
+            max_bucket (int): 이보다 큰 밴드 그룹은 후보에서 제외 (흔한 응답 패턴)
+            seed (int): 밴드 구성용 문항 순서 섞기 시드
+        """
+        cols = columns or self._data_columns(exclude=[id_col])
+        n, n_cols = len(self.df), len(cols)
+        if n < 2 or n_cols == 0:
+            return
+
+        # 문항별 값 → 정수 코드 (결측 = -1), 보기 수에 맞는 가장 작은 정수형
+        parts = []
+        for col in cols:
+            col_codes, uniques = pd.factorize(self.df[col])
+            parts.append(col_codes.astype(np.min_scalar_type(-max(len(uniques), 1))))
+        codes = np.column_stack(parts)
+        del parts
+
+        max_mismatch = int(np.floor((1 - threshold) * n_cols + 1e-9))
+        n_bands = min(max_mismatch + 1, n_cols)
+        order = np.random.default_rng(seed).permutation(n_cols)
+
+        # 후보쌍은 밴드 / 거리별로 chunk 개씩 바로 확인하고 에러 행만 남김
+        chunk = max(1, PAIR_CHUNK // n_cols)
+        mask = np.zeros(n, dtype=bool)
+        for band in np.array_split(order, n_bands):
+            band_hash = pd.util.hash_pandas_object(
+                pd.DataFrame(codes[:, band]), index=False
+            ).to_numpy()
+
+            # 해시 정렬 후 같은 그룹 안에서 거리 d 인 쌍들만 생성
+            pos = np.argsort(band_hash, kind='stable')
+            h = band_hash[pos]
+            starts = np.r_[True, h[1:] != h[:-1]]
+            group = np.cumsum(starts)
+            size = np.bincount(group)[group]
+            ok = (size >= 2) & (size <= max_bucket)
+
+            for d in range(1, min(int(size[ok].max(initial=1)), max_bucket)):
+                same = ok[:-d] & (group[:-d] == group[d:])
+                left, right = pos[:-d][same], pos[d:][same]
+
+                # 두 행 모두 이미 에러면 다시 볼 필요 없음
+                todo = ~(mask[left] & mask[right])
+                left, right = left[todo], right[todo]
+
+                for i in range(0, len(left), chunk):
+                    a, b = left[i:i + chunk], right[i:i + chunk]
+                    sim = (codes[a] == codes[b]).mean(axis=1)
+                    hit = sim >= threshold
+                    mask[a[hit]] = True
+                    mask[b[hit]] = True
+
+        idx = self.df.index[mask]
+        self._add_error(idx, id_col or cols[0], 'Error_유사응답자')
+
+    def straight_lining(self, cols, max_std=0, min_answered=3):
+        """그리드(척도) 문항 묶음에서 모두 같은 번호로 응답한 케이스 찾기
+
+        ex) B1_1 ~ B1_10 을 전부 3으로 응답
+
+        Args:
+            cols (list): 그리드 문항들
+            max_std (float): 행별 표준편차가 이 값 이하이면 에러 (0 = 완전 동일)
+            min_answered (int): 응답한 문항 수가 이보다 적으면 검사 제외
+        """
+        arr = self.df[cols].to_numpy(dtype=float, na_value=np.nan)
+        valid = ~np.isnan(arr)
+        count = valid.sum(axis=1)
+
+        # 결측 제외 행별 분산 (nanstd 경고 없이 직접 계산)
+        filled = np.where(valid, arr, 0.0)
+        mean = filled.sum(axis=1) / np.maximum(count, 1)
+        var = (np.where(valid, arr - mean[:, None], 0.0) ** 2).sum(axis=1) / np.maximum(count, 1)
+
+        mask = (count >= min_answered) & (np.sqrt(var) <= max_std)
+        idx = self.df.index[mask]
+        self._add_error(idx, cols[0], 'Error_일자응답')
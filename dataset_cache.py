@@ -0,0 +1,124 @@
+# =============================================================================
+# dataset_cache.py - 입력 파일 → 컬럼별 .npy 캐시 (memory-map 로 읽기)
+#
+# 같은 데이터를 규칙만 바꿔서 여러 번 검증할 때 매번 엑셀/CSV 를 다시
+# 파싱하지 않도록, 처음 한 번만 컬럼별 .npy 로 변환해 두고 이후에는
+# np.load(mmap_mode='c') 로 바로 붙인다. (파일 해시 + 시트명 기준)
+#
+#   data/.cache/<key>/meta.json      컬럼명, 저장 방식, 행 수
+#   data/.cache/<key>/c0.npy ...     숫자/날짜 컬럼 값
+#   data/.cache/<key>/c3.codes.npy   문자열 컬럼 코드 (+ c3.cats.npy)
+#
+# 숫자/날짜 컬럼은 복사 없이 memmap 그대로 DataFrame 에 들어간다.
+# 문자열 컬럼은 코드 → 값으로 풀어야 해서 그 컬럼만 메모리에 새로 만든다.
+# mmap_mode='c' 라서 여러 실행이 OS 페이지 캐시를 같이 쓰고,
+# 누가 값을 바꿔도 원본 캐시 파일에는 쓰지 않는다.
+# =============================================================================
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+CACHE_DIR = Path("data/.cache")
+
+# 그대로 .npy 로 저장 가능한 dtype 종류 (bool, int, uint, float, datetime, timedelta)
+RAW_KINDS = "biufMm"
+
+
+def file_key(path: str | Path, sheet_name: str | int = 0, chunk_size: int = 1 << 20) -> str:
+    """파일 내용 + 시트명 해시"""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    # repr: 시트 순번 0 과 시트명 '0' 을 다른 키로
+    h.update(f"\0{sheet_name!r}".encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+def parse_file(path: str | Path, sheet_name: str | int = 0) -> pd.DataFrame:
+    """원본 데이터 파싱 (csv / xlsx)"""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        return pd.read_csv(path)
+    return pd.read_excel(path, sheet_name=sheet_name)
+
+
+def _store(df: pd.DataFrame, target: Path) -> None:
+    """DataFrame 을 컬럼별 .npy 로 저장 (임시 폴더에 쓰고 rename)"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=target.parent, prefix=".tmp_"))
+
+    columns = []
+    for i, col in enumerate(df.columns):
+        s = df[col]
+        # 확장 dtype(Int64, tz 포함 datetime 등)은 numpy 배열이 아니라서 코드 방식으로 저장
+        if isinstance(s.dtype, np.dtype) and s.dtype.kind in RAW_KINDS:
+            np.save(tmp / f"c{i}.npy", np.ascontiguousarray(s.to_numpy()))
+            columns.append({"name": col, "kind": "raw"})
+        else:
+            codes, cats = pd.factorize(s)
+            np.save(tmp / f"c{i}.codes.npy", codes.astype(np.int32))
+            np.save(tmp / f"c{i}.cats.npy", np.asarray(cats, dtype=object), allow_pickle=True)
+            columns.append({"name": col, "kind": "codes"})
+
+    meta = {"n_rows": len(df), "columns": columns}
+    (tmp / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, default=str), encoding="utf-8")
+
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        # 다른 실행이 먼저 같은 캐시를 만든 경우
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _open(target: Path) -> pd.DataFrame:
+    """캐시 폴더 → DataFrame (raw 컬럼은 memmap 그대로)"""
+    meta = json.loads((target / "meta.json").read_text(encoding="utf-8"))
+
+    data = {}
+    for i, c in enumerate(meta["columns"]):
+        if c["kind"] == "raw":
+            values = np.load(target / f"c{i}.npy", mmap_mode="c")
+        else:
+            codes = np.load(target / f"c{i}.codes.npy", mmap_mode="r")
+            cats = np.load(target / f"c{i}.cats.npy", allow_pickle=True)
+            values = pd.Categorical.from_codes(codes, cats).astype(object)
+        data[c["name"]] = pd.Series(values, copy=False)
+
+    # copy=False: 컬럼 블록을 합치지 않고 memmap 을 그대로 사용
+    return pd.DataFrame(data, copy=False)
+
+
+def read_cached(
+    path: str | Path,
+    sheet_name: str | int = 0,
+    cache_dir: str | Path = CACHE_DIR,
+) -> pd.DataFrame:
+    """캐시가 있으면 memmap 으로 열고, 없으면 파싱 후 캐시 생성
+
+    Args:
+        path (str | Path): 원본 데이터 (csv / xlsx)
+        sheet_name (str | int): 엑셀 시트명 (csv면 무시)
+        cache_dir (str | Path): 캐시 저장 위치
+    """
+    path = Path(path)
+    target = Path(cache_dir) / file_key(path, sheet_name)
+
+    if not (target / "meta.json").exists():
+        _store(parse_file(path, sheet_name), target)
+
+    return _open(target)
+
+
+def clear_cache(cache_dir: str | Path = CACHE_DIR) -> None:
+    """캐시 폴더 삭제"""
+    shutil.rmtree(cache_dir, ignore_errors=True)
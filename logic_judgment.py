@@ -1,23 +1,10 @@
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-from dotenv import load_dotenv
-import os
 from pathlib import Path
 
 
-load_dotenv()
+# langchain_openai / dotenv 는 무거워서 실제 호출 시점에 import
 
-# gpt 모델 초기화
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
 
-
-
-# PDF에서 추출한 텍스트 불러오기
-text = Path("data/pdf_text(STI)_(설문지)_부산연구원_2025년 부산 청년패널조사_250623_상.txt").read_text(encoding="utf-8")
-
-messages = [
-    SystemMessage(
-        content=("""
+SYSTEM_PROMPT = """
                  너는 통계 조사 설문지를 분석하는 전문가다.
                  너의 임무는 설문지에 포함된 "설문지 로직"을 식별하는 것이다.
 
@@ -68,24 +55,68 @@ messages = [
                 - 로직이 전혀 없을 경우, "설문지 로직 없음"이라고만 출력한다.
                 - 각 추출 항목마다 왜 로직으로 판단했는지 1줄 근거를 원문 그대로 인용해라
                 """
-        )
-    ),
-    HumanMessage(
-        content=f"""
+
+
+def build_messages(text: str) -> list:
+    """설문지 텍스트로 LLM 메시지 구성"""
+    from langchain_core.messages import SystemMessage, HumanMessage
+
+    return [
+        SystemMessage(content=SYSTEM_PROMPT),
+        HumanMessage(
+            content=f"""
 아래는 설문지 원문 텍스트다.
 
 
 텍스트:
 {text}
 """
-    ),
-]
+        ),
+    ]
+
+
+def judge_logic(text: str, model: str = "gpt-4o-mini", question_ids=None, entries=None) -> str:
+    """설문지 텍스트에서 스킵/이동 로직 추출
+
+    question_ids 를 주면 해당 문항 구간만 LLM 에 보낸다. (utils/question_index)
+
+    Args:
+        text (str): 설문지 원문 텍스트
+        model (str): OpenAI 모델명
+        question_ids (list | None): 보낼 문항 ID (상위 문항이면 하위 문항 포함)
+        entries (list | None): 문항 색인 (없으면 text 에서 새로 만듦)
+    """
+    if question_ids:
+        from utils.question_index import build_question_index, get_segments
+
+        text = get_segments(text, entries or build_question_index(text), question_ids)
+
+    from dotenv import load_dotenv
+    from langchain_openai import ChatOpenAI
+
+    load_dotenv()
+
+    # gpt 모델 초기화
+    llm = ChatOpenAI(model=model, temperature=0)
+
+    response = llm.invoke(build_messages(text))
+    return response.content
+
+
+if __name__ == "__main__":
+    import sys
 
+    from utils.question_index import load_question_index, routing_question_ids
 
+    # PDF에서 추출한 텍스트 불러오기
+    text_path = Path("data/pdf_text(STI)_(설문지)_부산연구원_2025년 부산 청년패널조사_250623_상.txt")
+    text = text_path.read_text(encoding="utf-8")
+    entries = load_question_index(text_path)
 
-response = llm.invoke(messages)
+    # 인자로 준 문항 ID, 없으면 이동/종료 지시가 있는 문항만 보냄
+    question_ids = sys.argv[1:] or routing_question_ids(text, entries)
 
-print("TEXT_LEN:", len(text))
-# print("TEXT_HEAD:", text[:300])
+    print("TEXT_LEN:", len(text), "QUESTIONS:", len(entries), "SENT:", len(question_ids))
+    # print("TEXT_HEAD:", text[:300])
 
-print(response.content)
\ No newline at end of file
+    print(judge_logic(text, question_ids=question_ids, entries=entries))
@@ -1,6 +1,179 @@
-def main():
-    print("Hello from data-validation!")
+# =============================================================================
+# main.py - CLI 진입점
+#
+#   python main.py validate data/raw.xlsx --rules data/rules.json
+#   python main.py validate data/raw.xlsx --rules data/validation_cart.xlsx
+#   python main.py build-rules data/test.xlsx
+#   python main.py panel data/w1.xlsx data/w2.xlsx --id pid --rules data/panel_rules.json
+#   python main.py extract data/설문지.pdf --method docling
+#
+# 하위 명령에 필요한 모듈만 함수 안에서 import 한다.
+# (validate 가 docling / langchain / win32com 을 끌어오지 않도록)
+# =============================================================================
+import argparse
+import sys
+from pathlib import Path
+
+
+# 확장자별 기본 추출 방법
+EXTRACT_DEFAULTS = {".pdf": "pdfplumber", ".hwp": "hwp"}
+
+
+def sheet_arg(value: str) -> str | int:
+    """--sheet 값: 숫자면 시트 순번(int), 아니면 시트명"""
+    return int(value) if value.isdigit() else value
+
+
+def wave_names(paths) -> list[str]:
+    """웨이브 이름 = 파일명, 파일명이 겹치면 순번을 붙임 (w1/data.xlsx, w2/data.xlsx → 0_data, 1_data)"""
+    stems = [Path(p).stem for p in paths]
+    if len(set(stems)) == len(stems):
+        return stems
+    return [f"{i}_{stem}" for i, stem in enumerate(stems)]
+
+
+def cmd_validate(args) -> int:
+    from rule_engine import error_summary, load_rules, read_data, run_rules, write_data
+    from rule_normalize import normalize_rules
+
+    df = read_data(args.data, sheet_name=args.sheet, cache_dir=None if args.no_cache else args.cache_dir)
+
+    rules = normalize_rules(load_rules(args.rules, columns=df.columns))
+    meta = rules["metadata"]
+    print(f"규칙: {meta['normalized']['rules_in']} → {meta['normalized']['rules_out']}")
+    for w in meta.get("warnings", []):
+        print(f"[카트] {w}", file=sys.stderr)
+    for c in meta["conflicts"]:
+        print(f"[충돌] {c['reason']}: {', '.join(c['rule_ids'])}", file=sys.stderr)
+
+    if args.preview:
+        from preview import preview_passed, preview_rules
+
+        report = preview_rules(df, rules, sample_size=args.sample, strata=args.strata, threshold=args.threshold)
+        print(report.drop(columns=["rule_id"]).to_string(index=False))
+        if not preview_passed(report):
+            print("표본 검증 실패 → 전체 검증 생략", file=sys.stderr)
+            return 1
+
+    result = run_rules(df, rules, normalize=False, backend=args.backend)
+
+    out = args.out or Path(args.data).with_name(Path(args.data).stem + "_검증.xlsx")
+    write_data(result, out)
+
+    for col, n in error_summary(result).items():
+        print(f"{col}: {n}")
+    print("saved:", out)
+    return 0
+
+
+def cmd_panel(args) -> int:
+    import json
+
+    from panel_validation import PanelValidator
+    from rule_engine import error_summary, read_data, write_data
+
+    cache_dir = None if args.no_cache else args.cache_dir
+    names = wave_names(args.waves)
+    waves = {name: read_data(p, sheet_name=args.sheet, cache_dir=cache_dir) for name, p in zip(names, args.waves)}
+    rules = json.loads(Path(args.rules).read_text(encoding="utf-8"))
+
+    results = PanelValidator(waves, args.id).run_rules(rules)
+    for name, df in results.items():
+        out = write_data(df, Path(args.out_dir) / f"{name}_검증.xlsx")
+        print(name, error_summary(df), "saved:", out)
+    return 0
+
+
+def cmd_build_rules(args) -> int:
+    from codebook_rule import build_codebook_rules
+
+    for name, path in build_codebook_rules(args.codebook, args.sheet, args.out_dir).items():
+        print("saved:", name, path)
+    return 0
+
+
+def cmd_extract(args) -> int:
+    source = Path(args.source)
+    method = args.method or EXTRACT_DEFAULTS.get(source.suffix.lower())
+    out_dir = Path(args.out_dir)
+
+    if method == "pdfplumber":
+        from utils.pdf_text import extract_text_from_pdf
+        out = extract_text_from_pdf(source, out_dir / f"pdf_text{source.stem}.txt")
+    elif method == "ocr":
+        from utils.pdf_ocr_text import ocr_pdf_korean
+        out = ocr_pdf_korean(source, out_dir / f"pdf_ocr{source.stem}.txt")
+    elif method == "docling":
+        from utils.doc import pdf_to_markdown
+        out = pdf_to_markdown(source, out_dir)
+    elif method == "hwp":
+        from utils.hwp_text import hwp_to_txt
+        out = hwp_to_txt(source, out_dir / f"hwp_text{source.stem}.txt")
+    elif method == "hwp-pdf":
+        from utils.hwp_pdf import convert_hwp_to_pdf
+        out = convert_hwp_to_pdf(source, out_dir / f"{source.stem}.pdf")
+    else:
+        print(f"지원하지 않는 형식: {source.suffix} (--method 지정 필요)", file=sys.stderr)
+        return 2
+
+    print("saved:", out)
+
+    # 텍스트 결과는 문항 ID 색인도 같이 저장
+    if Path(out).suffix.lower() in (".txt", ".md"):
+        from utils.question_index import save_question_index
+        print("saved:", save_question_index(out))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="data-validation", description="설문 데이터 검증")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("validate", help="rules.json 으로 데이터 검증")
+    p.add_argument("data", help="검증 대상 데이터 (csv / xlsx)")
+    p.add_argument("--rules", required=True, help="rules.json 또는 검증 카트(.xlsx) 경로")
+    p.add_argument("--sheet", type=sheet_arg, default=0, help="엑셀 시트명 또는 순번(0부터)")
+    p.add_argument("--out", help="결과 저장 경로 (기본: <data>_검증.xlsx)")
+    p.add_argument("--cache-dir", default="data/.cache", help="데이터 memmap 캐시 위치")
+    p.add_argument("--no-cache", action="store_true", help="캐시 없이 매번 원본 파싱")
+    p.add_argument("--preview", action="store_true", help="표본 검증 먼저 실행, 실패하면 전체 검증 생략")
+    p.add_argument("--sample", type=int, default=2000, help="표본 크기")
+    p.add_argument("--strata", nargs="*", help="층화 컬럼")
+    p.add_argument("--threshold", type=float, default=0.05, help="허용 에러율")
+    p.add_argument("--backend", choices=["pandas", "numpy", "numba", "auto"], default="pandas",
+                   help="스킵/조건부 규칙 실행 방식 (numba 미설치 시 pandas)")
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("panel", help="패널 웨이브 간 검증")
+    p.add_argument("waves", nargs="+", help="웨이브 데이터 (웨이브 순서대로)")
+    p.add_argument("--id", required=True, help="응답자 ID 컬럼")
+    p.add_argument("--rules", required=True, help="패널 규칙 json (PanelRule 목록)")
+    p.add_argument("--sheet", type=sheet_arg, default=0, help="엑셀 시트명 또는 순번(0부터)")
+    p.add_argument("--out-dir", default="data", help="출력 디렉터리")
+    p.add_argument("--cache-dir", default="data/.cache", help="데이터 memmap 캐시 위치")
+    p.add_argument("--no-cache", action="store_true", help="캐시 없이 매번 원본 파싱")
+    p.set_defaults(func=cmd_panel)
+
+    p = sub.add_parser("build-rules", help="코드북에서 rules.json / 검증 카트 생성")
+    p.add_argument("codebook", nargs="?", default="data/test.xlsx", help="코드북 엑셀")
+    p.add_argument("--sheet", type=sheet_arg, default="codebook", help="코드북 시트명 또는 순번(0부터)")
+    p.add_argument("--out-dir", default="data", help="출력 디렉터리")
+    p.set_defaults(func=cmd_build_rules)
+
+    p = sub.add_parser("extract", help="설문지(pdf / hwp) 텍스트 추출")
+    p.add_argument("source", help="입력 파일")
+    p.add_argument("--method", choices=["pdfplumber", "ocr", "docling", "hwp", "hwp-pdf"],
+                   help="추출 방법 (기본: 확장자로 결정)")
+    p.add_argument("--out-dir", default="data", help="출력 디렉터리")
+    p.set_defaults(func=cmd_extract)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
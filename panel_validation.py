@@ -0,0 +1,157 @@
+# =============================================================================
+# panel_validation.py - 패널 조사 웨이브 간 검증 클래스
+#
+# 웨이브별 DataFrame 을 응답자 ID 기준으로 (응답자 수, 웨이브 수) 배열에
+# 한 번에 정렬해 두고, 문항별 규칙을 모든 웨이브에 대해 벡터 연산으로 검사한다.
+# 에러는 각 웨이브 df 에 DataValidator 와 같은 Error_ 컬럼으로 기록된다.
+# =============================================================================
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from data_validation import DataValidator
+from rule_schema import PanelRule
+
+
+class PanelValidator:
+    def __init__(self, waves, id_col):
+        """
+        Args:
+            waves (dict[str, pd.DataFrame]): 웨이브명 → 데이터 (입력 순서 = 웨이브 순서)
+            id_col (str): 응답자 ID 컬럼
+        """
+        self.waves = dict(waves)
+        self.id_col = id_col
+        self.validators = {name: DataValidator(df) for name, df in self.waves.items()}
+
+        # 모든 웨이브 ID 를 한 번에 해시 인덱싱 → 행마다 응답자 위치 (merge 반복 없음)
+        ids = [df[id_col].to_numpy() for df in self.waves.values()]
+        self._rows, self.ids = pd.factorize(np.concatenate(ids), sort=True)
+        self._wave = np.repeat(np.arange(len(ids)), [len(x) for x in ids])
+        self._offsets = np.cumsum([0] + [len(x) for x in ids])
+
+        # ID 결측(-1) 행과 한 웨이브 안에서 ID 가 중복된 행은 정렬 대상에서 제외
+        # (한 칸에 값 하나만 들어가므로 어느 한쪽이 덮어쓰지 않도록)
+        missing = self._rows < 0
+        key = pd.Series(self._rows * len(ids) + self._wave)
+        dup = ~missing & key.duplicated(keep=False).to_numpy()
+        self._valid = ~missing & ~dup
+
+        self._add_flat(missing, id_col, 'Error_패널ID결측')
+        self._add_flat(dup, id_col, 'Error_패널ID중복')
+
+    def _matrix(self, col):
+        """문항 col 을 (응답자 수, 웨이브 수) 배열로 정렬, 없는 응답은 NaN
+
+        숫자가 아닌 문항은 factorize 코드로 바꾸고 코드 → 값 목록을 같이 반환한다.
+        """
+        parts = [
+            df[col] if col in df.columns else pd.Series(np.nan, index=df.index)
+            for df in self.waves.values()
+        ]
+        values = pd.concat(parts, ignore_index=True)
+
+        uniques = None
+        if pd.api.types.is_numeric_dtype(values):
+            flat = values.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            codes, uniques = pd.factorize(values)
+            flat = np.where(codes < 0, np.nan, codes)
+
+        v = self._valid
+        mat = np.full((len(self.ids), len(self.waves)), np.nan)
+        mat[self._rows[v], self._wave[v]] = flat[v]
+        return mat, uniques
+
+    @staticmethod
+    def _previous(mat):
+        """각 칸 기준 직전 웨이브까지의 마지막 응답값 (없으면 NaN)"""
+        n, w = mat.shape
+        pos = np.where(~np.isnan(mat), np.arange(w), -1)
+        last = np.maximum.accumulate(pos, axis=1)
+        prev = np.full_like(mat, np.nan)
+        prev[:, 1:] = np.where(
+            last[:, :-1] >= 0,
+            mat[np.arange(n)[:, None], np.maximum(last[:, :-1], 0)],
+            np.nan,
+        )
+        return prev
+
+    def _add_errors(self, mask, col, error_col_name):
+        """(응답자, 웨이브) 에러 배열 → 각 웨이브 df 에 Error_ 기록"""
+        v = self._valid
+        flat = np.zeros(len(self._rows), dtype=bool)
+        flat[v] = mask[self._rows[v], self._wave[v]]
+        self._add_flat(flat, col, error_col_name)
+
+    def _add_flat(self, flat, col, error_col_name):
+        """전체 웨이브를 이어붙인 행 순서의 bool 배열 → 웨이브별 Error_ 기록"""
+        if not flat.any():
+            return
+        for i, validator in enumerate(self.validators.values()):
+            hit = flat[self._offsets[i]:self._offsets[i + 1]]
+            validator._add_error(validator.df.index[hit], col, error_col_name)
+
+    def stable(self, col):
+        """웨이브가 바뀌어도 값이 변하면 안 되는 문항 (출생연도, 성별 등)
+
+        첫 응답값과 다른 웨이브를 에러로 표시한다.
+
+        Args:
+            col (str): 검사 문항
+        """
+        mat, _ = self._matrix(col)
+        valid = ~np.isnan(mat)
+        first = mat[np.arange(len(mat)), valid.argmax(axis=1)]
+        mask = valid & (mat != first[:, None])
+        self._add_errors(mask, col, 'Error_패널불변')
+
+    def non_decreasing(self, col):
+        """이전 웨이브보다 값이 작아지면 안 되는 문항 (최종학력 등)
+
+        Args:
+            col (str): 검사 문항 (숫자형)
+        """
+        mat, _ = self._matrix(col)
+        mask = mat < self._previous(mat)   # NaN 비교는 False
+        self._add_errors(mask, col, 'Error_패널감소')
+
+    def allowed_transition(self, col, allowed):
+        """직전 응답값 → 현재 응답값 변화가 허용 목록에 없으면 에러
+        (값이 그대로인 경우는 항상 허용)
+
+        ex) 혼인상태 1(미혼) → 2(기혼) 허용, 2 → 1 불가 → allowed=[[1, 2], [2, 3]]
+
+        Args:
+            col (str): 검사 문항
+            allowed (list): 허용되는 [이전값, 현재값] 쌍 목록
+        """
+        mat, uniques = self._matrix(col)
+        prev = self._previous(mat)
+
+        if uniques is not None:
+            # 문자형 문항은 허용 쌍도 같은 코드로 변환 (데이터에 없는 값은 -1)
+            lookup = pd.Index(uniques)
+            allowed = [(lookup.get_indexer([a])[0], lookup.get_indexer([b])[0]) for a, b in allowed]
+
+        changed = ~np.isnan(mat) & ~np.isnan(prev) & (mat != prev)
+
+        # (이전, 현재) 쌍을 복소수 하나로 묶어 isin 검사
+        pair = np.where(changed, prev, 0) + 1j * np.where(changed, mat, 0)
+        allowed_pair = np.array([complex(a, b) for a, b in allowed], dtype=complex)
+        mask = changed & ~np.isin(pair, allowed_pair)
+        self._add_errors(mask, col, 'Error_패널전이')
+
+    def run_rules(self, rules: list[PanelRule]):
+        """패널 규칙 목록 실행
+
+        Returns:
+            dict[str, pd.DataFrame]: 웨이브명 → Error_ 컬럼이 붙은 df
+        """
+        for rule in rules:
+            if rule["rule_type"] == "allowed_transition":
+                self.allowed_transition(rule["item"], rule.get("allowed_transitions", []))
+            else:
+                getattr(self, rule["rule_type"])(rule["item"])
+        return {name: v.df for name, v in self.validators.items()}
@@ -0,0 +1,181 @@
+# =============================================================================
+# preview.py - 표본 검증 (전체 실행 전 빠른 점검)
+#
+# 업로드된 파일이 통째로 잘못됐는지(컬럼 밀림, 코드 밀림 등) 먼저 보기 위해
+# 층화 표본을 배치 단위로 검증하면서 규칙별 에러율과 신뢰구간을 추정한다.
+# 에러율 신뢰구간 하한이 기준을 넘은 규칙은 그 자리에서 검사를 멈춘다.
+#
+# 규칙은 표본 전체에 한 번만 실행해서 행별 에러 여부를 얻고,
+# 배치 경계마다의 누적 에러 수로 위 판단을 순서대로 한다 (배치마다 df 를 새로 만들지 않음).
+#
+# 배치마다 같은 구간을 다시 보면(반복 검정) 우연히 기준을 넘는 경우가 늘어나므로
+# 확인 횟수(⌈표본 / 배치⌉)로 유의수준을 나눈 z 값(Bonferroni)을 쓴다.
+# =============================================================================
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from data_validation import DataValidator
+from rule_normalize import normalize_rules, rule_kwargs
+from rule_schema import RulesJson
+
+
+# 행 간 비교 규칙은 표본으로 에러율을 추정할 수 없어서 제외
+CROSS_ROW_RULES = ("duplicate_respondent", "near_duplicate")
+
+
+def wilson_interval(k: int, n: int, z: float = 1.96) -> tuple[float, float]:
+    """이항 비율 Wilson 신뢰구간"""
+    if n == 0:
+        return 0.0, 1.0
+    p = k / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def sequential_z(alpha: float, looks: int) -> float:
+    """확인 횟수만큼 나눈 유의수준의 양측 z 값 (Bonferroni 보정)
+
+    looks 번 중 한 번이라도 구간이 참값을 벗어날 확률이 alpha 이하가 된다.
+    ex) alpha=0.05, looks=1 → 1.96 / looks=10 → 2.81
+    """
+    return NormalDist().inv_cdf(1 - alpha / (2 * max(looks, 1)))
+
+
+def stratified_sample(df: pd.DataFrame, size: int, strata=None, seed: int = 0) -> pd.DataFrame:
+    """층별 비례 배분 표본 (strata 없으면 단순 무작위), 순서는 섞어서 반환
+
+    Args:
+        df (pd.DataFrame): 원본 데이터
+        size (int): 표본 크기
+        strata (str | list | None): 층 컬럼 (지역, 조사원 등)
+        seed (int): 난수 시드
+    """
+    if size >= len(df):
+        sample = df
+    elif strata:
+        frac = size / len(df)
+        sample = df.groupby(strata, group_keys=False, dropna=False).sample(frac=frac, random_state=seed)
+    else:
+        sample = df.sample(n=size, random_state=seed)
+    return sample.sample(frac=1, random_state=seed)
+
+
+def _rule_errors(sample: pd.DataFrame, rule_type: str, kwargs: dict) -> np.ndarray:
+    """표본에서 규칙 하나로 에러가 난 행 (bool 배열)"""
+    # 얕은 복사: 규칙은 Error_ 컬럼만 새로 추가하므로 데이터 복사 불필요
+    validator = DataValidator(sample.copy(deep=False))
+    before = set(validator.df.columns)
+    getattr(validator, rule_type)(**kwargs)
+    new_cols = [c for c in validator.df.columns if c not in before]
+    if not new_cols:
+        return np.zeros(len(sample), dtype=bool)
+    return (validator.df[new_cols] != "").any(axis=1).to_numpy()
+
+
+def preview_rules(
+    df: pd.DataFrame,
+    rules: RulesJson,
+    sample_size: int = 2000,
+    strata=None,
+    threshold: float = 0.05,
+    batch_size: int = 200,
+    alpha: float = 0.05,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """표본 검증 후 규칙별 에러율 추정표 반환
+
+    status
+        - fail: 에러율 신뢰구간 하한 > threshold (조기 중단될 수 있음)
+        - pass: 에러율 신뢰구간 상한 <= threshold
+        - unclear: 표본으로 판단 불가 → 전체 실행 필요
+        - skipped: 행 간 비교 규칙이라 표본 검사 제외
+        - error: 규칙 실행 실패 (컬럼 없음 등)
+
+    배치마다 fail 여부를 보므로 신뢰구간은 확인 횟수(looks)로 보정한 z 값을 쓴다.
+    보고서의 z / looks 컬럼에 실제 사용한 값을 남긴다.
+
+    Args:
+        df (pd.DataFrame): 검증 대상 데이터
+        rules (RulesJson): 규칙 묶음 (정규화 전이면 여기서 정규화)
+        sample_size (int): 표본 크기
+        strata (str | list | None): 층화 컬럼
+        threshold (float): 허용 에러율
+        batch_size (int): 배치 크기 (배치마다 조기 중단 판단)
+        alpha (float): 전체 확인에 걸친 유의수준 (looks 로 나눠 z 값 계산)
+        seed (int): 표본 시드
+    """
+    # main.py 등에서 이미 정규화한 규칙이면 다시 하지 않음
+    if "normalized" not in rules.get("metadata", {}):
+        rules = normalize_rules(rules)
+    sample = stratified_sample(df, sample_size, strata, seed)
+    looks = math.ceil(len(sample) / batch_size)
+    z = sequential_z(alpha, looks)
+
+    state = []
+    for item in rules.get("items", []):
+        for rule in item.get("rules", []):
+            status = "skipped" if rule["rule_type"] in CROSS_ROW_RULES else None
+            state.append({
+                "rule_id": rule["rule_id"],
+                "rule_type": rule["rule_type"],
+                "item": item["item"],
+                "kwargs": rule_kwargs(item, rule),
+                "n": 0, "errors": 0, "status": status, "early_stop": False, "message": "",
+            })
+
+    # 배치 경계 (확인 시점) = 누적 확인 행 수
+    ends = np.minimum(np.arange(1, looks + 1) * batch_size, len(sample))
+
+    for s in state:
+        if s["status"] is not None:
+            continue
+        try:
+            hit = _rule_errors(sample, s["rule_type"], s["kwargs"])
+        except (KeyError, TypeError, ValueError) as e:
+            s["status"], s["message"] = "error", repr(e)
+            continue
+
+        cum = np.cumsum(hit)
+        s["n"], s["errors"] = len(sample), int(cum[-1]) if len(cum) else 0
+        for end in ends:
+            # 하한이 기준을 넘으면 더 볼 필요 없음
+            if wilson_interval(int(cum[end - 1]), int(end), z)[0] > threshold:
+                s["n"], s["errors"] = int(end), int(cum[end - 1])
+                s["status"] = "fail"
+                s["early_stop"] = end < len(sample)
+                break
+
+    rows = []
+    for s in state:
+        low, high = wilson_interval(s["errors"], s["n"], z)
+        status = s["status"] or ("pass" if high <= threshold else "unclear")
+        rows.append({
+            "rule_id": s["rule_id"],
+            "rule_type": s["rule_type"],
+            "item": s["item"],
+            "n_checked": s["n"],
+            "n_error": s["errors"],
+            "error_rate": s["errors"] / s["n"] if s["n"] else float("nan"),
+            "ci_low": low,
+            "ci_high": high,
+            "z": z,
+            "looks": looks,
+            "status": status,
+            "early_stop": s["early_stop"],
+            "message": s["message"],
+        })
+    return pd.DataFrame(rows)
+
+
+def preview_passed(report: pd.DataFrame) -> bool:
+    """fail / error 규칙이 하나도 없으면 True (전체 실행 진행)"""
+    if report.empty:
+        return True
+    return not report["status"].isin(["fail", "error"]).any()
@@ -0,0 +1,142 @@
+# =============================================================================
+# rule_engine.py - RulesJson 규칙을 DataValidator 메서드로 실행
+# =============================================================================
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from data_validation import DataValidator
+from dataset_cache import parse_file, read_cached
+from rule_normalize import normalize_rules, rule_kwargs
+from rule_schema import RulesJson
+
+
+def read_data(
+    path: str | Path,
+    sheet_name: str | int = 0,
+    cache_dir: str | Path | None = None,
+) -> pd.DataFrame:
+    """검증 대상 데이터 불러오기 (csv / xlsx)
+
+    Args:
+        path (str | Path): 데이터 파일 경로
+        sheet_name (str | int): 엑셀 시트명 (csv면 무시)
+        cache_dir (str | Path | None): 지정하면 memmap 캐시 사용 (dataset_cache)
+    """
+    if cache_dir is not None:
+        return read_cached(path, sheet_name, cache_dir)
+    return parse_file(path, sheet_name)
+
+
+def write_data(df: pd.DataFrame, path: str | Path) -> Path:
+    """검증 결과 저장 (확장자에 따라 csv / xlsx)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == ".csv":
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+    else:
+        df.to_excel(path, index=False)
+    return path
+
+
+# 여러 문항을 한 번에 받는 규칙 → 나머지 인자가 같으면 호출 하나로 묶음
+BATCHABLE = {
+    "miss_value": (),
+    "multiple_response_check": (),
+    "between_a_b": ("min", "max"),
+}
+
+
+def load_rules(path: str | Path, columns=None) -> RulesJson:
+    """rules.json 또는 검증 카트(.xlsx) 불러오기
+
+    Args:
+        path (str | Path): rules.json / validation_cart.xlsx
+        columns (list | None): 데이터 컬럼명 (카트의 문항명 확인용)
+    """
+    path = Path(path)
+    if path.suffix.lower() in (".xlsx", ".xlsm"):
+        from utils.excel_load import load_cart_xlsx
+        return load_cart_xlsx(path, columns)
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compile_plan(rules: RulesJson) -> list[tuple[str, dict]]:
+    """규칙 → (DataValidator 메서드명, 인자) 실행 계획
+
+    BATCHABLE 규칙은 문항을 모아 한 번만 호출한다.
+    ex) 결측 규칙 300개 → miss_value(columns=[300개 문항]) 1회
+    """
+    plan = []
+    batches: dict[tuple, dict] = {}
+
+    for item in rules.get("items", []):
+        for rule in item.get("rules", []):
+            rule_type = rule["rule_type"]
+            kwargs = rule_kwargs(item, rule)
+            # 범위 정보가 없는 between_a_b 는 건너뜀
+            if rule_type == "between_a_b" and (kwargs["min"] is None or kwargs["max"] is None):
+                continue
+
+            extra = BATCHABLE.get(rule_type)
+            if extra is not None and set(kwargs) == {"columns", *extra}:
+                key = (rule_type,) + tuple(kwargs[k] for k in extra)
+                if key in batches:
+                    batches[key]["columns"].extend(kwargs["columns"])
+                    continue
+                kwargs = {**kwargs, "columns": list(kwargs["columns"])}
+                batches[key] = kwargs
+
+            plan.append((rule_type, kwargs))
+
+    return plan
+
+
+def run_plan(df: pd.DataFrame, plan: list[tuple[str, dict]], backend: str = "pandas") -> pd.DataFrame:
+    """compile_plan 결과 실행 후 Error_ 컬럼이 붙은 df 반환
+
+    Args:
+        df (pd.DataFrame): 검증 대상 데이터
+        plan (list): compile_plan 결과
+        backend (str): 'pandas' / 'numpy' / 'numba' / 'auto' (스킵/조건부 규칙 실행 방식, rule_kernel)
+    """
+    if backend != "pandas":
+        from rule_kernel import run_plan_kernel
+        return run_plan_kernel(df, plan, backend)
+
+    validator = DataValidator(df)
+    for rule_type, kwargs in plan:
+        getattr(validator, rule_type)(**kwargs)
+    return validator.df
+
+
+def run_rules(
+    df: pd.DataFrame,
+    rules: RulesJson,
+    normalize: bool = True,
+    backend: str = "pandas",
+) -> pd.DataFrame:
+    """RulesJson의 모든 규칙을 실행하고 Error_ 컬럼이 붙은 df 반환
+
+    Args:
+        df (pd.DataFrame): 검증 대상 데이터
+        rules (RulesJson): 규칙 묶음
+        normalize (bool): 실행 전 중복 제거/범위 병합 (이미 정규화했으면 False)
+        backend (str): 스킵/조건부 규칙 실행 방식 (run_plan 참고)
+    """
+    if normalize:
+        rules = normalize_rules(rules)
+
+    return run_plan(df, compile_plan(rules), backend)
+
+
+def error_summary(df: pd.DataFrame) -> dict[str, int]:
+    """Error_ 컬럼별 에러 행 수"""
+    return {
+        col: int((df[col] != "").sum())
+        for col in df.columns
+        if str(col).startswith("Error_")
+    }
@@ -0,0 +1,308 @@
+# =============================================================================
+# rule_kernel.py - 스킵/조건부 규칙 전용 실행 백엔드
+#
+# skip_pattern / early_end / require_missing / require_value / conditional_mapping
+# 은 모두 "조건 문항 값이 X 인 행에서 다른 문항 결측 여부/값 확인" 형태다.
+# pandas 로 돌리면 규칙마다 전체 길이 임시 Series 가 여러 개 생기므로,
+# 규칙 묶음을 한 번에 컴파일해서 실행한다.
+#
+#   numpy : 조건을 먼저 걸러서 해당 행만 확인하는 벡터 연산 (auto 기본값)
+#   numba : 규칙 전체를 루프 커널 하나로 실행 (설치된 경우)
+#
+# 커널로 옮길 수 없는 규칙(문자 조건값, 숫자가 아닌 조건 문항 등)과
+# 나머지 규칙은 기존 DataValidator 메서드로 실행한다.
+# 에러 기록은 에러명별로 모아 _add_error_mask 로 한 번에 하며, 문항 순서는 실행 계획
+# 순서를 따르므로 결과 df 는 pandas 와 동일하다.
+# =============================================================================
+from __future__ import annotations
+
+import functools
+import numbers
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from data_validation import DataValidator
+
+
+# 규칙 타입 → (에러명, 연산 코드)
+KERNEL_RULES = {
+    "skip_pattern": ('Error_문항스킵', 0),
+    "early_end": ('Error_조기종료', 0),        # 조건 행에서 범위 문항 중 응답이 하나라도 있으면 에러
+    "require_missing": ('Error_조건부결측', 1),
+    "require_value": ('Error_조건부필수', 2),
+    "conditional_mapping": ('Error_조건부로직', 3),
+}
+
+BACKENDS = ("pandas", "numpy", "numba", "auto")
+
+# 이 행 수 이상이고 스레드가 여러 개면 numba 커널을 행 병렬(prange)로 실행
+PARALLEL_ROWS = 1_000_000
+
+
+@functools.cache
+def numba_available() -> bool:
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _numbers(values) -> list | None:
+    """조건값 목록이 모두 숫자(결측 제외)면 float 리스트, 아니면 None"""
+    if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+        return None
+    out = []
+    for v in values:
+        if not isinstance(v, numbers.Real) or pd.isna(v):
+            return None
+        out.append(float(v))
+    return out
+
+
+class _Columns:
+    """문항 → float64 배열 (같은 문항은 한 번만 변환)
+
+    숫자 문항은 값 그대로(결측 NaN, float64 면 복사 없음),
+    숫자가 아닌 문항은 결측 여부만 필요할 때 응답 있음 = 0.0 / 결측 = NaN 으로 둔다.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._cache = {}
+
+    def numeric(self, col) -> bool:
+        dtype = self.df[col].dtype
+        return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+    def get(self, col) -> np.ndarray:
+        if col not in self._cache:
+            s = self.df[col]
+            if self.numeric(col):
+                self._cache[col] = s.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                self._cache[col] = np.where(s.notna().to_numpy(), 0.0, np.nan)
+        return self._cache[col]
+
+
+def _spec(df, cols: _Columns, rule_type, kwargs) -> dict | None:
+    """규칙 하나 → 커널 명세 (커널로 못 옮기면 None → pandas 실행)"""
+    if rule_type not in KERNEL_RULES:
+        return None
+    error_col, op = KERNEL_RULES[rule_type]
+
+    try:
+        if rule_type == "skip_pattern":
+            cond, mark = kwargs["start_col"], kwargs["start_col"]
+            vals, vals2, target = _numbers([kwargs["value"]]), [], None
+            start = df.columns.get_loc(kwargs["start_col"])
+            end = df.columns.get_loc(kwargs["end_col"])
+            if not isinstance(start, int) or not isinstance(end, int):
+                return None
+            rng = list(df.columns[start + 1:end])
+        elif rule_type == "early_end":
+            cond, mark = kwargs["column"], kwargs["column"]
+            vals, vals2, target = _numbers([kwargs["value"]]), [], None
+            # DataValidator.early_end 과 같게 Error_ 컬럼 제외 원본 컬럼 기준
+            original = [c for c in df.columns if not str(c).startswith('Error_')]
+            rng = original[original.index(cond) + 1:]
+        elif rule_type == "conditional_mapping":
+            cond, mark, target = kwargs["col1"], kwargs["col1"], kwargs["col2"]
+            vals, vals2, rng = _numbers(kwargs["val1"]), _numbers(kwargs["val2"]), []
+            if vals2 is None or not cols.numeric(target):
+                return None
+        else:
+            cond, mark, target = kwargs["col1"], kwargs["col1"], kwargs["col2"]
+            vals, vals2, rng = _numbers(kwargs["val"]), [], []
+    except (KeyError, ValueError):
+        return None
+
+    if vals is None or cond not in df.columns or not cols.numeric(cond):
+        return None
+    if target is not None and target not in df.columns:
+        return None
+
+    return {"op": op, "cond": cond, "vals": vals, "target": target, "vals2": vals2,
+            "range": rng, "mark": mark, "error_col": error_col}
+
+
+def _mask_numpy(spec, cols: _Columns, n) -> np.ndarray:
+    """조건 행만 골라서 확인 (전체 길이 임시 배열은 조건 1개뿐)"""
+    rows = np.flatnonzero(np.isin(cols.get(spec["cond"]), spec["vals"]))
+    hit = np.zeros(n, dtype=bool)
+    op = spec["op"]
+
+    if op == 0:
+        # 아직 응답을 못 찾은 행만 다음 문항에서 확인
+        pending = rows
+        for col in spec["range"]:
+            if len(pending) == 0:
+                break
+            found = ~np.isnan(cols.get(col)[pending])
+            hit[pending[found]] = True
+            pending = pending[~found]
+    elif op == 1:
+        hit[rows] = np.isnan(cols.get(spec["target"])[rows])
+    elif op == 2:
+        hit[rows] = ~np.isnan(cols.get(spec["target"])[rows])
+    else:
+        hit[rows] = np.isin(cols.get(spec["target"])[rows], spec["vals2"])
+    return hit
+
+
+@functools.cache
+def _numba_kernel(parallel: bool):
+    """parallel=False 면 prange 는 range 로 동작 (캐시는 직렬 커널만)"""
+    import numba
+
+    def kernel(X, ops, cond, target, vals, voff, vals2, v2off, rng, roff, out):
+        # X: 문항별 1차원 float64 배열 목록, out: (규칙, 행)
+        # 조건 분기 대신 bool 연산으로 이어서 씀 (응답값이 섞여 있으면 분기 예측 실패가 큼)
+        n = out.shape[1]
+        matched = np.empty(n, dtype=np.bool_)
+        for r in range(ops.shape[0]):
+            x = X[cond[r]]
+            y = X[target[r]]
+            op = ops[r]
+            for i in numba.prange(n):
+                m = False
+                for k in range(voff[r], voff[r + 1]):
+                    m |= x[i] == vals[k]
+                matched[i] = m
+
+            if op == 0:
+                for k in range(roff[r], roff[r + 1]):
+                    z = X[rng[k]]
+                    for i in numba.prange(n):
+                        out[r, i] |= matched[i] & (not np.isnan(z[i]))
+            elif op == 1:
+                for i in numba.prange(n):
+                    out[r, i] = matched[i] & np.isnan(y[i])
+            elif op == 2:
+                for i in numba.prange(n):
+                    out[r, i] = matched[i] & (not np.isnan(y[i]))
+            else:
+                for i in numba.prange(n):
+                    m = False
+                    for k in range(v2off[r], v2off[r + 1]):
+                        m |= y[i] == vals2[k]
+                    out[r, i] = matched[i] & m
+
+    if parallel:
+        return numba.njit(parallel=True)(kernel)
+    return numba.njit(cache=True)(kernel)
+
+
+def _masks_numba(specs, cols: _Columns, n) -> np.ndarray:
+    """규칙 전체를 커널 하나로 실행 → (행, 규칙) bool"""
+    from numba.typed import List
+
+    names = []
+    pos = {}
+
+    def at(col):
+        if col not in pos:
+            pos[col] = len(names)
+            names.append(col)
+        return pos[col]
+
+    cond = np.array([at(s["cond"]) for s in specs], dtype=np.int64)
+    target = np.array([at(s["target"]) if s["target"] is not None else 0 for s in specs], dtype=np.int64)
+    rng = np.array([at(c) for s in specs for c in s["range"]], dtype=np.int64)
+
+    def offsets(key):
+        return np.cumsum([0] + [len(s[key]) for s in specs]).astype(np.int64)
+
+    # 문항별 배열을 그대로 넘김 (float64 문항은 복사 없음)
+    X = List([np.ascontiguousarray(cols.get(col)) for col in names])
+
+    out = np.zeros((len(specs), n), dtype=np.bool_)
+    import numba
+
+    _numba_kernel(n >= PARALLEL_ROWS and numba.config.NUMBA_NUM_THREADS > 1)(
+        X,
+        np.array([s["op"] for s in specs], dtype=np.int64),
+        cond, target,
+        np.array([v for s in specs for v in s["vals"]], dtype=np.float64), offsets("vals"),
+        np.array([v for s in specs for v in s["vals2"]], dtype=np.float64), offsets("vals2"),
+        rng, offsets("range"),
+        out,
+    )
+    return out.T
+
+
+def resolve_backend(backend: str) -> str:
+    """auto → numpy, numba 미설치 → pandas
+
+    numba 는 문항이 적고 행이 아주 많을 때만 numpy 보다 빨라서 명시했을 때만 쓴다.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend 는 {BACKENDS} 중 하나: {backend}")
+    if backend == "auto":
+        return "numpy"
+    if backend == "numba" and not numba_available():
+        warnings.warn("numba 가 설치되어 있지 않아 pandas 로 실행합니다.")
+        return "pandas"
+    return backend
+
+
+def run_plan_kernel(df: pd.DataFrame, plan: list[tuple[str, dict]], backend: str = "auto") -> pd.DataFrame:
+    """실행 계획 중 스킵/조건부 규칙은 커널로, 나머지는 DataValidator 로 실행
+
+    Args:
+        df (pd.DataFrame): 검증 대상 데이터
+        plan (list): rule_engine.compile_plan 결과
+        backend (str): 'numpy' / 'numba' / 'auto' ('pandas' 면 커널 없이 실행)
+    """
+    backend = resolve_backend(backend)
+    validator = DataValidator(df)
+    cols = _Columns(df)
+
+    specs = [None if backend == "pandas" else _spec(df, cols, rt, kw) for rt, kw in plan]
+    active = [s for s in specs if s is not None]
+
+    # 데이터 값은 어떤 규칙도 바꾸지 않으므로 에러 행은 미리 한 번에 계산
+    masks = {}
+    if active:
+        if backend == "numba":
+            out = _masks_numba(active, cols, len(df))
+            masks = {id(s): out[:, r] for r, s in enumerate(active)}
+        else:
+            masks = {id(s): _mask_numpy(s, cols, len(df)) for s in active}
+
+    # 에러명별로 (표시 문항, 에러 행) 을 모았다가 한 번에 기록
+    pending: dict[str, list] = {}
+
+    def flush(error_col):
+        marks = pending.pop(error_col, [])
+        if marks:
+            mask = pd.DataFrame(np.column_stack([m for _, m in marks]), index=validator.df.index,
+                                columns=[c for c, _ in marks])
+            validator._add_error_mask(mask, error_col)
+
+    for (rule_type, kwargs), spec in zip(plan, specs):
+        if spec is None:
+            # 같은 에러명을 pandas 로 기록하면 앞선 커널 결과를 먼저 기록 (문항 순서 유지)
+            if rule_type in KERNEL_RULES:
+                flush(KERNEL_RULES[rule_type][0])
+            getattr(validator, rule_type)(**kwargs)
+        else:
+            # 에러 컬럼 위치는 pandas 실행과 같게 규칙 순서대로 생성
+            if spec["error_col"] not in validator.df.columns:
+                validator.df[spec["error_col"]] = ''
+            pending.setdefault(spec["error_col"], []).append((spec["mark"], masks[id(spec)]))
+
+    for error_col in list(pending):
+        flush(error_col)
+    return validator.df
+
+
+def verify_backend(df: pd.DataFrame, plan: list[tuple[str, dict]], backend: str = "auto") -> None:
+    """커널 결과가 기존 pandas 메서드 결과와 같은지 확인 (다르면 AssertionError)"""
+    from rule_engine import run_plan
+
+    expected = run_plan(df.copy(), plan)
+    actual = run_plan_kernel(df.copy(), plan, backend)
+    pd.testing.assert_frame_equal(actual, expected)
@@ -0,0 +1,228 @@
+# =============================================================================
+# rule_normalize.py - 규칙 정규화 / 중복 제거 / 충돌 탐지
+#
+# codebook / llm / manual 에서 들어온 규칙은 같은 내용이 표기만 다르게
+# 여러 번 들어오는 경우가 많다. 실행 전에 실제 호출 인자 기준으로 정규화해서
+# 같은 규칙은 한 번만 실행되도록 한다.
+# =============================================================================
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from data_validation import canonical_op
+from rule_schema import ItemSpec, Rule, RulesJson
+
+
+# 같은 규칙이 여러 소스에서 왔을 때 남길 우선순위 (작을수록 우선)
+SOURCE_PRIORITY = {"manual": 0, "codebook": 1, "llm": 2}
+
+# 순서가 의미 없는 값 목록 인자 (isin 조건)
+SET_PARAMS = ("val", "val1", "val2")
+
+# 둘 다 있으면 모든 행이 에러가 되는 연산자 쌍
+COMPLEMENT_OPS = {("<", ">="), (">=", "<"), (">", "<="), ("<=", ">"), ("==", "!="), ("!=", "==")}
+
+
+def _allowed_codes(item: ItemSpec, rule: Rule) -> list:
+    """명시형(allowed_values) 우선, 없으면 domain.allowed_codes 사용"""
+    codes = rule.get("allowed_values") or item.get("domain", {}).get("allowed_codes") or []
+    return [c for c in codes if isinstance(c, (int, float))]
+
+
+def rule_kwargs(item: ItemSpec, rule: Rule) -> dict[str, Any]:
+    """규칙 하나를 DataValidator 메서드 인자로 변환
+
+    단일 문항 규칙(miss_value 등)은 item 기준으로 인자를 채우고,
+    나머지는 rule['params']를 그대로 사용한다. params가 있으면 기본값을 덮어쓴다.
+    """
+    rule_type = rule["rule_type"]
+    name = item["item"]
+    kwargs: dict[str, Any] = {}
+
+    if rule_type in ("miss_value", "multiple_response_check"):
+        kwargs = {"columns": [name]}
+    elif rule_type == "between_a_b":
+        codes = _allowed_codes(item, rule)
+        lo = rule.get("min")
+        hi = rule.get("max")
+        kwargs = {
+            "columns": [name],
+            "min": lo if lo is not None else (min(codes) if codes else None),
+            "max": hi if hi is not None else (max(codes) if codes else None),
+        }
+
+    kwargs.update(rule.get("params", {}))
+    return kwargs
+
+
+def _canon_value(v):
+    """2.0 → 2, 리스트/딕셔너리는 재귀 처리"""
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    if isinstance(v, (list, tuple)):
+        return [_canon_value(x) for x in v]
+    if isinstance(v, dict):
+        return {k: _canon_value(x) for k, x in v.items()}
+    return v
+
+
+def canonical_params(item: ItemSpec, rule: Rule) -> dict[str, Any]:
+    """실제 실행될 인자를 표기 차이 없이 정리"""
+    params = _canon_value(rule_kwargs(item, rule))
+
+    if "method" in params:
+        params["method"] = canonical_op(params["method"])
+    if "ct" in params and "compare" in params["ct"]:
+        params["ct"] = {**params["ct"], "compare": canonical_op(params["ct"]["compare"])}
+
+    for key in SET_PARAMS:
+        if isinstance(params.get(key), list):
+            params[key] = sorted(set(params[key]), key=lambda x: (type(x).__name__, x))
+
+    return params
+
+
+def canonical_rule_id(rule_type: str, params: dict[str, Any]) -> str:
+    """rule_type + 정규화 인자 해시"""
+    key = json.dumps([rule_type, params], sort_keys=True, ensure_ascii=False, default=str)
+    return "r_" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def _rank(rule: Rule) -> tuple:
+    """중복 규칙 중 남길 규칙 순서: confidence 높은 순 → 소스 우선순위"""
+    return (-rule.get("confidence", 0.0), SOURCE_PRIORITY.get(rule.get("source"), len(SOURCE_PRIORITY)))
+
+
+def _overlap(a, b) -> bool:
+    a = a if isinstance(a, list) else [a]
+    b = b if isinstance(b, list) else [b]
+    return bool(set(a) & set(b))
+
+
+def _conflict_key(rule: Rule) -> tuple | None:
+    """충돌 가능한 규칙끼리만 같은 키 (규칙 계열, 대상 문항)"""
+    p = rule["params"]
+    rule_type = rule["rule_type"]
+    if rule_type in ("require_missing", "require_value"):
+        return ("require", p.get("col1"), p.get("col2"))
+    if rule_type == "comparison_columns":
+        return (rule_type, p.get("col1"), p.get("col2"))
+    if rule_type == "comparison_value":
+        return (rule_type, p.get("col"), json.dumps(p.get("val"), default=str))
+    return None
+
+
+def _is_conflict(a: Rule, b: Rule) -> str | None:
+    """같은 키 안의 두 규칙이 상충하면 이유 반환"""
+    pa, pb = a["params"], b["params"]
+    types = {a["rule_type"], b["rule_type"]}
+
+    # 같은 조건에서 결측이어야 하면서 값이 있어야 함
+    if types == {"require_missing", "require_value"}:
+        if _overlap(pa.get("val"), pb.get("val")):
+            return "require_missing / require_value 조건 겹침"
+
+    # 같은 대상에 서로 반대 연산자
+    elif types in ({"comparison_columns"}, {"comparison_value"}):
+        if (pa.get("method"), pb.get("method")) in COMPLEMENT_OPS:
+            return f"{a['rule_type']} 연산자 상충"
+    return None
+
+
+def _find_conflicts(rules: list[Rule]) -> list[dict]:
+    """같이 실행하면 모든 대상 행이 에러가 되는 규칙 쌍 찾기
+
+    (규칙 계열, 대상 문항) 별로 묶은 뒤 같은 묶음 안에서만 비교한다.
+    """
+    buckets: dict[tuple, list[Rule]] = {}
+    for rule in rules:
+        key = _conflict_key(rule)
+        if key is not None:
+            buckets.setdefault(key, []).append(rule)
+
+    conflicts = []
+    for group in buckets.values():
+        for i, a in enumerate(group):
+            for b in group[i + 1:]:
+                reason = _is_conflict(a, b)
+                if reason:
+                    conflicts.append({"rule_ids": [a["rule_id"], b["rule_id"]], "reason": reason})
+    return conflicts
+
+
+def normalize_rules(rules: RulesJson) -> RulesJson:
+    """규칙 정규화 → 중복 제거 → 범위 병합 → 충돌 탐지
+
+    - 연산자 표기 통일 ('<(작다)' → '<'), 값 목록 정렬, 2.0 → 2
+    - 실제 실행 인자 기준 해시(rule_id)가 같으면 하나만 남김
+    - 같은 문항의 between_a_b 여러 개는 범위 교집합 하나로 병합
+    - 상충 규칙은 metadata['conflicts']에 기록 (규칙은 그대로 둠)
+
+    정규화된 규칙은 실행 인자를 모두 params에 담고 있다.
+
+    Args:
+        rules (RulesJson): 원본 규칙 묶음
+
+    Returns:
+        RulesJson: 정규화된 규칙 묶음
+    """
+    items = rules.get("items", [])
+    kept: dict[str, tuple[int, Rule]] = {}     # rule_id → (item 위치, 규칙)
+    n_in = 0
+
+    for pos, item in enumerate(items):
+        for rule in item.get("rules", []):
+            n_in += 1
+            params = canonical_params(item, rule)
+
+            # 범위 정보가 없는 between_a_b 는 실행 대상 아님
+            if rule["rule_type"] == "between_a_b" and (params["min"] is None or params["max"] is None):
+                continue
+
+            rid = canonical_rule_id(rule["rule_type"], params)
+            new = {k: v for k, v in rule.items() if k not in ("min", "max", "allowed_values")}
+            new.update(rule_id=rid, params=params)
+
+            if rid not in kept or _rank(new) < _rank(kept[rid][1]):
+                kept[rid] = (kept[rid][0] if rid in kept else pos, new)
+
+    conflicts = []
+
+    # 같은 문항 범위 규칙 → 교집합 하나로
+    ranges: dict[tuple, list[str]] = {}
+    for rid, (_, rule) in kept.items():
+        if rule["rule_type"] == "between_a_b":
+            ranges.setdefault(tuple(rule["params"]["columns"]), []).append(rid)
+
+    for rids in ranges.values():
+        if len(rids) < 2:
+            continue
+        group = [kept[r] for r in rids]
+        lo = max(r["params"]["min"] for _, r in group)
+        hi = min(r["params"]["max"] for _, r in group)
+        if lo > hi:
+            conflicts.append({"rule_ids": rids, "reason": f"between_a_b 범위 교집합 없음 ({lo} > {hi})"})
+            continue
+
+        pos, best = min(group, key=lambda x: _rank(x[1]))
+        for r in rids:
+            del kept[r]
+        params = {**best["params"], "min": lo, "max": hi}
+        rid = canonical_rule_id("between_a_b", params)
+        kept[rid] = (pos, {**best, "rule_id": rid, "params": params})
+
+    conflicts += _find_conflicts([rule for _, rule in kept.values()])
+
+    # 원래 item 구조로 되돌리기 (규칙은 처음 나온 item 아래)
+    out_items = [{**item, "rules": []} for item in items]
+    for pos, rule in kept.values():
+        out_items[pos]["rules"].append(rule)
+
+    metadata = {
+        **rules.get("metadata", {}),
+        "normalized": {"rules_in": n_in, "rules_out": len(kept)},
+        "conflicts": conflicts,
+    }
+    return {**rules, "items": out_items, "metadata": metadata}
@@ -17,7 +17,17 @@ RuleType = Literal[
     "require_value",
     "conditional_mapping",
     "comparison", 
-    "exclusive_multi_value"
+    "exclusive_multi_value",
+    "duplicate_respondent",
+    "near_duplicate",
+    "straight_lining"
+]
+
+# 패널(웨이브 간) 규칙 타입
+PanelRuleType = Literal[
+    "stable",
+    "non_decreasing",
+    "allowed_transition"
 ]
 
 RuleSource = Literal["codebook", "llm", "manual"]
@@ -70,6 +80,10 @@ class Rule(TypedDict, total=False):
     # 조건부 규칙 대비(나중 확장)
     condition: NotRequired[Condition]
 
+    # DataValidator 메서드에 그대로 넘길 인자
+    # ex) skip_pattern → {"start_col": "Q3", "value": 2, "end_col": "Q6"}
+    params: NotRequired[Dict[str, Any]]
+
     # (선택) 사람이 읽기 위한 설명
     description: NotRequired[str]
 
@@ -89,3 +103,14 @@ class RulesJson(TypedDict, total=False):
 
     # (선택) 메타데이터
     metadata: Dict[str, Any]
+
+
+# ---- panel rule ----
+class PanelRule(TypedDict, total=False):
+    item: str
+    rule_type: PanelRuleType
+
+    # allowed_transition 전용: 허용되는 [이전값, 현재값] 쌍
+    allowed_transitions: NotRequired[List[List[Union[int, str]]]]
+
+    description: NotRequired[str]
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_validation import DataValidator
+
+
+def errors(df, col):
+    return list(df[col]) if col in df.columns else [""] * len(df)
+
+
+def brute_near_duplicate(df, threshold):
+    """모든 행 쌍의 일치율 (결측끼리는 같다고 봄)"""
+    arr = df.to_numpy(dtype=float)
+    same = (arr[:, None, :] == arr[None, :, :]) | (np.isnan(arr)[:, None, :] & np.isnan(arr)[None, :, :])
+    sim = same.mean(axis=2)
+    np.fill_diagonal(sim, 0)
+    return (sim >= threshold).any(axis=1)
+
+
+@pytest.mark.parametrize("threshold", [0.7, 0.8, 0.9])
+@pytest.mark.parametrize("seed", range(5))
+def test_near_duplicate_matches_brute_force(seed, threshold):
+    rng = np.random.default_rng(seed)
+    arr = rng.integers(1, 4, (150, 10)).astype(float)
+    arr[rng.random(arr.shape) < 0.1] = np.nan
+    # 일부 행은 다른 행을 복사한 뒤 몇 문항만 바꿈
+    src = rng.choice(150, 30, replace=False)
+    for a, b in zip(src[:15], src[15:]):
+        arr[b] = arr[a]
+        flip = rng.choice(10, rng.integers(0, 4), replace=False)
+        arr[b, flip] = rng.integers(1, 4, len(flip))
+    df = pd.DataFrame(arr, columns=[f"Q{i}" for i in range(10)])
+
+    validator = DataValidator(df.copy())
+    validator.near_duplicate(threshold=threshold, max_bucket=len(df))
+
+    expected = brute_near_duplicate(df, threshold)
+    assert expected.any()
+    assert [e != "" for e in errors(validator.df, "Error_유사응답자")] == list(expected)
+
+
+def test_near_duplicate_small_chunks(monkeypatch):
+    import data_validation
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.integers(1, 3, (120, 6)), columns=list("abcdef"))
+    monkeypatch.setattr(data_validation, "PAIR_CHUNK", 7)
+    validator = DataValidator(df.copy())
+    validator.near_duplicate(threshold=0.8, max_bucket=len(df))
+
+    assert [e != "" for e in errors(validator.df, "Error_유사응답자")] == list(brute_near_duplicate(df, 0.8))
+
+
+def test_duplicate_respondent():
+    df = pd.DataFrame({"pid": [1, 2, 3, 4], "Q1": [1, 1, 2, 1], "Q2": [np.nan, np.nan, 1, 2]})
+    validator = DataValidator(df)
+    validator.duplicate_respondent(id_col="pid")
+    assert errors(validator.df, "Error_중복응답자") == ["pid", "pid", "", ""]
+
+
+def test_straight_lining():
+    df = pd.DataFrame({
+        "B1": [3, 3, 1, 2, 4],
+        "B2": [3, 3, 2, 2, np.nan],
+        "B3": [3, np.nan, 3, 2, np.nan],
+        "B4": [3, 3, 4, np.nan, np.nan],
+    })
+    validator = DataValidator(df)
+    validator.straight_lining(["B1", "B2", "B3", "B4"])
+    # 응답 3개 미만(마지막 행)은 검사 제외
+    assert errors(validator.df, "Error_일자응답") == ["B1", "B1", "", "B1", ""]
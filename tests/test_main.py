@@ -0,0 +1,24 @@
+from main import build_parser, wave_names
+
+
+def test_wave_names_unique_stems():
+    assert wave_names(["data/w1.xlsx", "data/w2.csv"]) == ["w1", "w2"]
+
+
+def test_wave_names_duplicate_stems_keep_every_wave():
+    assert wave_names(["w1/data.xlsx", "w2/data.xlsx", "w3/other.csv"]) == ["0_data", "1_data", "2_other"]
+
+
+def test_panel_runs_every_wave_with_same_file_name(tmp_path):
+    for wave, births in (("w1", "1990\n1985"), ("w2", "1990\n1980")):
+        (tmp_path / wave).mkdir()
+        (tmp_path / wave / "data.csv").write_text("pid,birth\n1," + births.replace("\n", "\n2,") + "\n")
+    rules = tmp_path / "panel_rules.json"
+    rules.write_text('[{"rule_type": "stable", "item": "birth"}]')
+
+    args = build_parser().parse_args([
+        "panel", str(tmp_path / "w1" / "data.csv"), str(tmp_path / "w2" / "data.csv"),
+        "--id", "pid", "--rules", str(rules), "--out-dir", str(tmp_path / "out"), "--no-cache",
+    ])
+    assert args.func(args) == 0
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["0_data_검증.xlsx", "1_data_검증.xlsx"]
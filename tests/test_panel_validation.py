@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from panel_validation import PanelValidator
+
+
+def errors(df, col):
+    return list(df[col]) if col in df.columns else [""] * len(df)
+
+
+def test_missing_id_not_aligned_to_other_respondent():
+    waves = {
+        "w1": pd.DataFrame({"pid": [1, 2, 3], "birth": [1990, 1985, 1970]}),
+        "w2": pd.DataFrame({"pid": [1, 2, np.nan], "birth": [1990, 1985, 1980]}),
+    }
+    panel = PanelValidator(waves, "pid")
+    panel.stable("birth")
+
+    w2 = panel.validators["w2"].df
+    assert errors(w2, "Error_패널불변") == ["", "", ""]
+    assert list(w2["Error_패널ID결측"]) == ["", "", "pid"]
+    assert errors(panel.validators["w1"].df, "Error_패널불변") == ["", "", ""]
+
+
+def test_duplicate_id_in_wave_reported():
+    waves = {
+        "w1": pd.DataFrame({"pid": [1, 2], "birth": [1990, 1985]}),
+        "w2": pd.DataFrame({"pid": [1, 1, 2], "birth": [1990, 1985, 1985]}),
+    }
+    panel = PanelValidator(waves, "pid")
+    panel.stable("birth")
+
+    w2 = panel.validators["w2"].df
+    assert list(w2["Error_패널ID중복"]) == ["pid", "pid", ""]
+    # 중복 행은 어느 한쪽 값으로 비교하지 않음
+    assert errors(w2, "Error_패널불변") == ["", "", ""]
+    assert errors(panel.validators["w1"].df, "Error_패널ID중복") == ["", ""]
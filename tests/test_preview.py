@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from preview import preview_passed, preview_rules, sequential_z, stratified_sample
+
+
+def make_rules(*items):
+    return {"metadata": {}, "items": [{"item": name, "rules": rules} for name, rules in items]}
+
+
+def test_sequential_z_grows_with_looks():
+    assert round(sequential_z(0.05, 1), 2) == 1.96
+    assert sequential_z(0.05, 10) > sequential_z(0.05, 2) > sequential_z(0.05, 1)
+
+
+def test_preview_early_stop_and_status():
+    rng = np.random.default_rng(0)
+    n = 1000
+    q1 = rng.integers(1, 6, n).astype(float)
+    q1[:] = np.where(rng.random(n) < 0.5, np.nan, q1)          # 결측 약 50%
+    df = pd.DataFrame({"Q1": q1, "Q2": rng.integers(1, 6, n)})
+    rules = make_rules(
+        ("Q1", [{"rule_type": "miss_value"}]),
+        ("Q2", [{"rule_type": "between_a_b", "min": 1, "max": 5}]),
+        ("Q3", [{"rule_type": "miss_value"}]),                  # 없는 문항
+        ("Q2", [{"rule_type": "near_duplicate", "params": {"columns": ["Q1", "Q2"]}}]),
+    )
+
+    report = preview_rules(df, rules, sample_size=1000, batch_size=100).set_index("item")
+
+    fail = report.loc["Q1"]
+    assert fail["status"] == "fail"
+    assert fail["early_stop"] and fail["n_checked"] == 100
+    # 첫 배치(표본 앞 100행)의 누적 에러 수
+    assert fail["n_error"] == stratified_sample(df, 1000).iloc[:100]["Q1"].isna().sum()
+
+    rows = report[report["rule_type"] == "between_a_b"].iloc[0]
+    assert rows["status"] == "pass" and rows["n_checked"] == 1000 and rows["n_error"] == 0
+
+    assert report.loc["Q3", "status"] == "error"
+    assert (report["rule_type"] == "near_duplicate").sum() == 1
+    assert report.loc[report["rule_type"] == "near_duplicate", "status"].item() == "skipped"
+    assert set(report["looks"]) == {10}
+    assert not preview_passed(report.reset_index())
@@ -0,0 +1,41 @@
+from utils.question_index import build_question_index, get_segments, routing_question_ids
+
+
+TEXT = """\
+B1. 현재 결혼 상태는?
+  ① 미혼 → B2 로 이동
+B2 로 이동하세요
+B2. 혼인 여부
+B2-1. 혼인 연도
+B2-2) 배우자 연령
+B3: 자녀 수
+"""
+
+
+def test_routing_line_before_question():
+    entries = {e["id"]: e for e in build_question_index(TEXT)}
+
+    assert TEXT[entries["B2"]["start"]:].startswith("B2. 혼인")
+    assert entries["B2"]["line"] == 4
+    assert [e["id"] for e in build_question_index(TEXT)] == ["B1", "B2", "B2-1", "B2-2", "B3"]
+
+    b1 = TEXT[entries["B1"]["start"]:entries["B1"]["end"]]
+    assert "B2. 혼인" not in b1
+
+    b2 = get_segments(TEXT, list(entries.values()), ["B2"])
+    assert b2.startswith("B2. 혼인")
+    assert "B2-1. 혼인 연도" in b2 and "B2-2) 배우자 연령" in b2
+    assert "B3" not in b2
+
+
+def test_header_without_punct_still_indexed():
+    # 마크다운 제목처럼 문장부호 없는 줄만 있으면 처음 줄 사용
+    entries = build_question_index("## A1 성별\n## A2 연령\n")
+    assert [e["id"] for e in entries] == ["A1", "A2"]
+
+
+def test_routing_question_ids():
+    text = TEXT + "B4. 기타 의견\n  ⑤ 기타(▶ )\nB5. 취업 여부\n  ② 아니오 → 설문 종료\n"
+    entries = build_question_index(text)
+    # 상위 문항은 자기 구간(하위 문항 전까지)만 봄
+    assert routing_question_ids(text, entries) == ["B1", "B5"]
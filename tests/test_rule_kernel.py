@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rule_kernel import verify_backend
+
+BACKENDS = ["numpy", pytest.param("numba", marks=pytest.mark.skipif(
+    not __import__("rule_kernel").numba_available(), reason="numba 미설치"))]
+
+
+def random_data(rng, n=300, k=8):
+    data = {}
+    for j in range(k):
+        v = rng.integers(1, 5, n).astype(float)
+        v[rng.random(n) < 0.3] = np.nan
+        data[f"Q{j}"] = v
+    data["Q3"] = rng.integers(1, 5, n)                                     # int64 (결측 없음)
+    data["S"] = np.where(rng.random(n) < 0.5, "기타", None)                # 문자 문항
+    data["C"] = pd.Series(rng.choice(["a", "b", None], n), dtype="category")
+    return pd.DataFrame(data)
+
+
+def random_plan(rng, columns, size=40):
+    numeric = [c for c in columns if c.startswith("Q")]
+    objects = ["S", "C"]
+
+    def pick(pool=numeric):
+        return str(rng.choice(pool))
+
+    def codes():
+        # 결측 조건값(NaN)이 섞이면 커널 대신 pandas 로 실행되어야 함
+        vals = [int(v) for v in rng.choice([1, 2, 3, 4], rng.integers(1, 3), replace=False)]
+        return vals + [np.nan] if rng.random() < 0.15 else vals
+
+    plan = []
+    for _ in range(size):
+        kind = rng.integers(0, 8)
+        if kind == 0:
+            # end_col 이 start_col 보다 앞이면 확인할 문항 없음
+            plan.append(("skip_pattern", {"start_col": pick(), "value": int(rng.integers(1, 5)), "end_col": pick()}))
+        elif kind == 1:
+            plan.append(("early_end", {"column": pick(), "value": int(rng.integers(1, 5))}))
+        elif kind == 2:
+            plan.append(("require_missing", {"col1": pick(), "val": codes(), "col2": pick(numeric + objects)}))
+        elif kind == 3:
+            plan.append(("require_value", {"col1": pick(), "val": codes(), "col2": pick(numeric + objects)}))
+        elif kind == 4:
+            plan.append(("conditional_mapping", {"col1": pick(), "val1": codes(),
+                                                 "col2": pick(numeric + objects), "val2": codes()}))
+        elif kind == 5:
+            # 숫자가 아닌 조건 문항 → pandas 실행
+            plan.append(("require_value", {"col1": pick(objects), "val": ["기타", "a"], "col2": pick()}))
+        elif kind == 6:
+            plan.append(("miss_value", {"columns": list(rng.choice(numeric, 3, replace=False))}))
+        else:
+            plan.append(("same_value", {"col1": pick(), "col2": pick()}))
+    return plan
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("seed", range(10))
+def test_kernel_matches_pandas(backend, seed):
+    rng = np.random.default_rng(seed)
+    df = random_data(rng)
+    verify_backend(df, random_plan(rng, df.columns), backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_end_col_before_start_col(backend):
+    df = pd.DataFrame({"Q1": [1.0, 2.0], "Q2": [1.0, np.nan], "Q3": [1.0, 1.0]})
+    plan = [("skip_pattern", {"start_col": "Q3", "value": 1, "end_col": "Q1"}),
+            ("skip_pattern", {"start_col": "Q1", "value": 1, "end_col": "Q3"})]
+    verify_backend(df, plan, backend)
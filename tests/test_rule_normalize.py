@@ -0,0 +1,102 @@
+from rule_normalize import normalize_rules
+
+
+def rules_of(*items):
+    return {"metadata": {}, "items": [{"item": name, "rules": rules} for name, rules in items]}
+
+
+def out_rules(result):
+    return [rule for item in result["items"] for rule in item["rules"]]
+
+
+def test_operator_label_and_symbol_are_one_rule():
+    result = normalize_rules(rules_of(
+        ("Q1", [{"rule_type": "comparison_columns", "params": {"col1": "Q1", "col2": "Q2", "method": "<(작다)"}}]),
+        ("Q2", [{"rule_type": "comparison_columns", "params": {"col1": "Q1", "col2": "Q2", "method": "<"}}]),
+    ))
+    rules = out_rules(result)
+    assert len(rules) == 1
+    assert rules[0]["params"]["method"] == "<"
+    # 규칙은 처음 나온 item 아래에 남음
+    assert [len(item["rules"]) for item in result["items"]] == [1, 0]
+    assert result["metadata"]["normalized"] == {"rules_in": 2, "rules_out": 1}
+
+
+def test_value_order_and_float_codes_deduplicated():
+    result = normalize_rules(rules_of(("Q1", [
+        {"rule_type": "require_missing", "params": {"col1": "Q1", "val": [2, 1], "col2": "Q2"}},
+        {"rule_type": "require_missing", "params": {"col1": "Q1", "val": [1.0, 2.0, 2], "col2": "Q2"}},
+    ])))
+    rules = out_rules(result)
+    assert len(rules) == 1
+    assert rules[0]["params"]["val"] == [1, 2]
+
+
+def test_between_ranges_intersected():
+    result = normalize_rules(rules_of(("Q1", [
+        {"rule_type": "between_a_b", "min": 1, "max": 5},
+        {"rule_type": "between_a_b", "min": 1, "max": 4, "source": "manual"},
+    ])))
+    rules = out_rules(result)
+    assert len(rules) == 1
+    assert (rules[0]["params"]["min"], rules[0]["params"]["max"]) == (1, 4)
+    assert result["metadata"]["conflicts"] == []
+
+
+def test_empty_range_intersection_is_conflict():
+    result = normalize_rules(rules_of(("Q1", [
+        {"rule_type": "between_a_b", "min": 1, "max": 3},
+        {"rule_type": "between_a_b", "min": 5, "max": 7},
+    ])))
+    conflicts = result["metadata"]["conflicts"]
+    assert len(conflicts) == 1
+    assert len(conflicts[0]["rule_ids"]) == 2
+    assert "between_a_b" in conflicts[0]["reason"]
+    # 충돌이면 병합하지 않고 둘 다 남김
+    assert len(out_rules(result)) == 2
+
+
+def test_require_missing_value_conflict():
+    result = normalize_rules(rules_of(("Q1", [
+        {"rule_type": "require_missing", "params": {"col1": "Q1", "val": [1, 2], "col2": "Q2"}},
+        {"rule_type": "require_value", "params": {"col1": "Q1", "val": [2, 3], "col2": "Q2"}},
+        # 조건값이 안 겹치면 충돌 아님
+        {"rule_type": "require_value", "params": {"col1": "Q1", "val": [4], "col2": "Q2"}},
+    ])))
+    conflicts = result["metadata"]["conflicts"]
+    assert len(conflicts) == 1
+    assert "require_missing" in conflicts[0]["reason"]
+
+
+def test_complementary_comparison_conflict():
+    result = normalize_rules(rules_of(("Q1", [
+        {"rule_type": "comparison_columns", "params": {"col1": "Q1", "col2": "Q2", "method": "<(작다)"}},
+        {"rule_type": "comparison_columns", "params": {"col1": "Q1", "col2": "Q2", "method": ">="}},
+        {"rule_type": "comparison_value", "params": {"col": "Q1", "val": 3, "method": "=="}},
+        {"rule_type": "comparison_value", "params": {"col": "Q1", "val": 3.0, "method": "!=(다르다)"}},
+        # 다른 기준값끼리는 충돌 아님
+        {"rule_type": "comparison_value", "params": {"col": "Q1", "val": 4, "method": "=="}},
+    ])))
+    reasons = sorted(c["reason"] for c in result["metadata"]["conflicts"])
+    assert reasons == ["comparison_columns 연산자 상충", "comparison_value 연산자 상충"]
+
+
+def test_idempotent():
+    once = normalize_rules(rules_of(
+        ("Q1", [
+            {"rule_type": "between_a_b", "min": 1, "max": 5},
+            {"rule_type": "between_a_b", "min": 2.0, "max": 4},
+            {"rule_type": "miss_value"},
+            {"rule_type": "require_missing", "params": {"col1": "Q1", "val": [2, 1], "col2": "Q2"}},
+            {"rule_type": "require_value", "params": {"col1": "Q1", "val": [1], "col2": "Q2"}},
+        ]),
+        ("Q2", [
+            {"rule_type": "miss_value"},
+            {"rule_type": "comparison_columns", "params": {"col1": "Q1", "col2": "Q2", "method": "<(작다)"}},
+        ]),
+    ))
+    twice = normalize_rules(once)
+    assert twice["items"] == once["items"]
+    assert twice["metadata"]["conflicts"] == once["metadata"]["conflicts"]
+    n = len(out_rules(once))
+    assert twice["metadata"]["normalized"] == {"rules_in": n, "rules_out": n}
@@ -1,26 +1,36 @@
 from pathlib import Path
-from docling.document_converter import DocumentConverter
 
 # 실행 40~50초, 글자 잘 나옴, 표 같은 레이아웃 지킴
+# docling 은 import 만으로도 수 초가 걸려서 함수 안에서 import
 
 
-# 입력 PDF
-source = "data/(STI)_(설문지)_부산연구원_2025년 부산 청년패널조사_250623_상.pdf"
+def pdf_to_markdown(source: str | Path, out_dir: str | Path = "data") -> Path:
+    """docling으로 PDF → markdown 변환 후 저장
 
-# 출력 디렉터리
-out_dir = Path("data")
+    Args:
+        source (str | Path): 입력 PDF
+        out_dir (str | Path): 출력 디렉터리
+    """
+    from docling.document_converter import DocumentConverter
 
-# 출력 파일명 (PDF 이름 그대로 .md)
-out_md = out_dir / (Path(source).stem + ".md")
+    # 출력 파일명 (PDF 이름 그대로 .md)
+    out_md = Path(out_dir) / (Path(source).stem + ".md")
+    out_md.parent.mkdir(parents=True, exist_ok=True)
 
-# 변환
-converter = DocumentConverter()
-result = converter.convert(source)
+    # 변환
+    converter = DocumentConverter()
+    result = converter.convert(str(source))
 
-# markdown 추출
-markdown_text = result.document.export_to_markdown()
+    # markdown 추출
+    markdown_text = result.document.export_to_markdown()
 
-# 파일 저장 (UTF-8)
-out_md.write_text(markdown_text, encoding="utf-8")
+    # 파일 저장 (UTF-8)
+    out_md.write_text(markdown_text, encoding="utf-8")
+    return out_md
 
-print(f"Markdown 저장 완료: {out_md}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    # 입력 PDF
+    out_md = pdf_to_markdown("data/(STI)_(설문지)_부산연구원_2025년 부산 청년패널조사_250623_상.pdf")
+
+    print(f"Markdown 저장 완료: {out_md}")
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+from openpyxl import load_workbook
+
+from rule_schema import RulesJson
+
+
+# 카트 1행 제목 → 규칙 타입 (export_cart_xlsx 로 만든 제목 + rule_type 이름 그대로)
+CART_TITLES = {
+    "결측": "miss_value",
+    "중복 응답": "multiple_response_check",
+    "중복응답": "multiple_response_check",
+    "범위": "between_a_b",
+    "miss_value": "miss_value",
+    "multiple_response_check": "multiple_response_check",
+    "between_a_b": "between_a_b",
+}
+
+
+def _split(text) -> list[str]:
+    """'A1, A2,A3' → ['A1', 'A2', 'A3']"""
+    if text is None:
+        return []
+    return [s.strip() for s in str(text).split(",") if s.strip()]
+
+
+def load_cart_xlsx(
+    path: str | Path = Path("data/validation_cart.xlsx"),
+    columns: Iterable[str] | None = None,
+) -> RulesJson:
+    """
+    export_cart_xlsx 로 만든(또는 사람이 고친) 검증 카트를 RulesJson 으로 읽는다.
+
+    1행 title / 2행 items(쉼표 구분) / 3행 values 인 컬럼 블록을
+    왼쪽부터 읽으며, 1~3행만 스트리밍으로 읽는다(read_only).
+
+    columns: 데이터 컬럼명. 주면 없는 문항은 규칙에서 빼고 metadata['warnings'] 에 남긴다.
+    """
+    known = set(columns) if columns is not None else None
+    warnings: list[str] = []
+    items: dict[str, list] = {}     # 문항 → 규칙 목록 (처음 나온 순서 유지)
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        rows = list(ws.iter_rows(min_row=1, max_row=3, values_only=True))
+    finally:
+        wb.close()
+
+    rows += [()] * (3 - len(rows))
+    width = max(len(r) for r in rows)
+    titles, item_row, value_row = (list(r) + [None] * (width - len(r)) for r in rows)
+
+    for col, (title, item_text, values) in enumerate(zip(titles, item_row, value_row), start=1):
+        if title is None or str(title).strip() == "":
+            continue
+
+        rule_type = CART_TITLES.get(str(title).strip())
+        if rule_type is None:
+            warnings.append(f"{col}열: 알 수 없는 제목 '{title}'")
+            continue
+
+        rule = {"rule_type": rule_type, "source": "manual"}
+        if rule_type == "between_a_b":
+            bounds = _split(values)
+            try:
+                rule["min"], rule["max"] = (float(b) for b in bounds)
+            except ValueError:
+                warnings.append(f"{col}열: 범위 값 '{values}' 은 'min, max' 형식이어야 함")
+                continue
+
+        for name in _split(item_text):
+            if known is not None and name not in known:
+                warnings.append(f"{col}열: 데이터에 없는 문항 '{name}'")
+                continue
+            items.setdefault(name, []).append({**rule, "rule_id": f"cart:{col}:{name}:{rule_type}"})
+
+    return {
+        "version": "1",
+        "items": [{"item": name, "rules": rules} for name, rules in items.items()],
+        "metadata": {"source": "cart", "path": str(path), "warnings": warnings},
+    }
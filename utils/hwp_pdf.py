@@ -1,4 +1,3 @@
-import win32com.client
 from pathlib import Path
 
 
@@ -7,6 +6,9 @@ def convert_hwp_to_pdf(hwp_path: str | Path, pdf_path: str | Path):
     pdf_path = Path(pdf_path).resolve()
     pdf_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # win32com 은 윈도우 전용이라 호출 시점에 import
+    import win32com.client
+
     hwp = win32com.client.gencache.EnsureDispatch("HWPFrame.HwpObject")
     hwp.RegisterModule("FilePathCheckDLL", "SecurityModule")
 
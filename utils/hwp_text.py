@@ -1,6 +1,4 @@
 import os
-from pyhwpx import Hwp
-
 
 
 def hwp_to_txt(hwp_path: str, out_txt: str):
@@ -18,7 +16,9 @@ def hwp_to_txt(hwp_path: str, out_txt: str):
     # 한글이 항상 CP949(ANSI)로 저장하므로 중간파일 필요
     tmp_txt = out_txt + ".ansi.txt"
     
-    # 한글 실행
+    # 한글 실행 (pyhwpx 는 윈도우 전용이라 호출 시점에 import)
+    from pyhwpx import Hwp
+
     hwp = Hwp()
 
     # 한글 파일 열기
@@ -41,7 +41,9 @@ def hwp_to_txt(hwp_path: str, out_txt: str):
         f.write(text)
 
     os.remove(tmp_txt)
+    return out_txt
 
 
 # 사용 예시
-hwp_to_txt("data/(STI)_(설문지)_부산연구원_2025년 부산 청년패널조사_250623_상.hwp", "data/hwp_text(STI)_(설문지)_부산연구원_2025년 부산 청년패널조사_250623_상.txt")
+if __name__ == "__main__":
+    hwp_to_txt("data/(STI)_(설문지)_부산연구원_2025년 부산 청년패널조사_250623_상.hwp", "data/hwp_text(STI)_(설문지)_부산연구원_2025년 부산 청년패널조사_250623_상.txt")
@@ -1,6 +1,4 @@
 from pathlib import Path
-from pdf2image import convert_from_path
-import pytesseract
 
 
 # 레이아웃형태도 불안정하고 글자도 제대로 인식못함 
@@ -21,6 +19,9 @@ def ocr_pdf_korean(
     pdf_path = Path(pdf_path)
     out_txt = Path(out_txt)
 
+    from pdf2image import convert_from_path
+    import pytesseract
+
     # tesseract 경로 지정 (Windows 필수)
     pytesseract.pytesseract.tesseract_cmd = TESSERACT_EXE
 
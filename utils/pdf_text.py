@@ -1,6 +1,4 @@
-import pdfplumber
 from pathlib import Path
-import win32com.client
 
 # 텍스트 추출은 제일잘하나 표 글자가 뒤죽박죽으로 나옴
 # 빠름
@@ -9,6 +7,8 @@ def extract_text_from_pdf(pdf_path: str | Path, out_txt: str | Path):
     pdf_path = Path(pdf_path)
     out_txt = Path(out_txt)
 
+    import pdfplumber
+
     texts = []
     with pdfplumber.open(pdf_path) as pdf:
         for i, page in enumerate(pdf.pages, start=1):
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Iterable
+
+# 설문지 텍스트(.txt / .md)에서 문항 ID(B2, C3-2 ...) 별 위치 색인
+# 한 번 훑어서 {문항 ID: 시작~끝 오프셋, 페이지, 상위 문항} 을 만들고
+# 텍스트 옆에 <파일명>.qidx.json 으로 저장해 둔다.
+# 이후 단계(logic_judgment 등)는 필요한 문항 구간만 잘라서 쓴다.
+
+
+# 줄 맨 앞의 문항 ID (마크다운 기호 / 'Q' 접두 허용, 'B2로 이동' 같은 본문은 제외)
+# ID 뒤 문장부호(punct)가 있으면 문항 머리, 공백만 있으면 후보 ('B2 로 이동하세요' 등)
+QUESTION_RE = re.compile(
+    r"^[ \t]*(?:[#>*|\-]+[ \t]*)*(?:Q[ \t]*)?(?P<qid>[A-Z]{1,3}\d+(?:-\d+)*)(?:(?P<punct>[.):\]])|(?=\s|$))",
+    re.MULTILINE,
+)
+
+# 이동/건너뛰기/종료 지시 문구 ('기타(▶ )' 같은 기입란 표시는 제외)
+ROUTING_RE = re.compile(r"이동|건너|종료|→|☞|go\s*to", re.IGNORECASE)
+
+# pdf_text / pdf_ocr_text 가 넣는 페이지 구분선
+PAGE_RE = re.compile(r"^===== PAGE (\d+) =====$", re.MULTILINE)
+
+
+def _parent(qid: str) -> str | None:
+    """'C3-2' → 'C3', 'C3' → None"""
+    return qid.rsplit("-", 1)[0] if "-" in qid else None
+
+
+def build_question_index(text: str) -> list[dict]:
+    """
+    텍스트에서 문항 ID 별 구간 목록 생성.
+
+    같은 ID 가 여러 번 줄머리에 나오면 ID 뒤에 문장부호(. ) : ])가 붙은 첫 줄을,
+    그런 줄이 없으면 처음 줄을 사용한다.
+    ('B2 로 이동하세요' 같은 안내문이 실제 'B2. 혼인' 보다 먼저 나와도 됨)
+    상위 문항(C3)의 구간은 하위 문항(C3-1, C3-2 ...)까지 포함한다.
+
+    반환값: [{"id", "start", "end", "page", "parent", "line"}, ...] (등장 순서)
+    """
+    pages = [(m.start(), int(m.group(1))) for m in PAGE_RE.finditer(text)]
+    page_starts = [p[0] for p in pages]
+
+    best: dict[str, tuple[bool, int]] = {}     # ID → (문장부호 여부, 줄 시작)
+    for m in QUESTION_RE.finditer(text):
+        qid = m.group("qid")
+        punct = m.group("punct") is not None
+        if qid not in best or (punct and not best[qid][0]):
+            best[qid] = (punct, m.start())     # 줄 시작 (접두 기호 포함)
+    heads = sorted(((qid, start) for qid, (_, start) in best.items()), key=lambda h: h[1])
+
+    entries = []
+    stack: list[dict] = []          # 아직 끝이 정해지지 않은 상위 문항들
+    line, last = 1, 0
+    for qid, start in heads:
+        # 자기 하위 문항이 아닌 문항이 나오면 구간 종료
+        while stack and not qid.startswith(stack[-1]["id"] + "-"):
+            stack.pop()["end"] = start
+
+        line += text.count("\n", last, start)
+        last = start
+        k = bisect.bisect_right(page_starts, start) - 1
+
+        entry = {
+            "id": qid,
+            "start": start,
+            "end": len(text),
+            "page": pages[k][1] if k >= 0 else None,
+            "parent": _parent(qid),
+            "line": line,
+        }
+        entries.append(entry)
+        stack.append(entry)
+    return entries
+
+
+def routing_question_ids(text: str, entries: list[dict]) -> list[str]:
+    """자기 구간(하위 문항 전까지)에 이동/종료 지시가 있는 문항 ID 목록
+
+    logic_judgment 에 설문지 전체 대신 분기 있는 문항만 보낼 때 사용.
+    """
+    starts = sorted(e["start"] for e in entries) + [len(text)]
+    ids = []
+    for e in entries:
+        own_end = starts[bisect.bisect_right(starts, e["start"])]
+        if ROUTING_RE.search(text, e["start"], own_end):
+            ids.append(e["id"])
+    return ids
+
+
+def index_path(text_path: str | Path) -> Path:
+    """텍스트 파일 옆 색인 파일 경로"""
+    text_path = Path(text_path)
+    return text_path.with_name(text_path.name + ".qidx.json")
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def save_question_index(text_path: str | Path) -> Path:
+    """텍스트 파일을 색인해서 옆에 저장"""
+    text = Path(text_path).read_text(encoding="utf-8")
+    out = index_path(text_path)
+    out.write_text(
+        json.dumps(
+            {"source": Path(text_path).name, "sha1": _digest(text), "entries": build_question_index(text)},
+            ensure_ascii=False, indent=2,
+        ),
+        encoding="utf-8",
+    )
+    return out
+
+
+def load_question_index(text_path: str | Path) -> list[dict]:
+    """저장된 색인 불러오기 (없거나 텍스트가 바뀌었으면 다시 만듦)"""
+    out = index_path(text_path)
+    if out.exists():
+        data = json.loads(out.read_text(encoding="utf-8"))
+        text = Path(text_path).read_text(encoding="utf-8")
+        if data.get("sha1") == _digest(text):
+            return data["entries"]
+    save_question_index(text_path)
+    return json.loads(out.read_text(encoding="utf-8"))["entries"]
+
+
+def get_segments(text: str, entries: list[dict], ids: Iterable[str]) -> str:
+    """요청한 문항 ID 구간만 잘라 붙인 텍스트 (겹치는 구간은 한 번만)
+
+    'C3' 처럼 상위 문항을 주면 하위 문항 구간까지 포함된다.
+    """
+    by_id = {e["id"]: e for e in entries}
+    spans = sorted((by_id[q]["start"], by_id[q]["end"]) for q in set(ids) if q in by_id)
+
+    merged: list[list[int]] = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    return "\n\n".join(text[s:e].strip() for s, e in merged)